@@ -4,12 +4,16 @@ Excel Map Link to Coordinates Converter
 Converts map links in Excel files to longitude and latitude coordinates.
 """
 
+import numpy as np
 import pandas as pd
 import re
 import sys
 import logging
-from typing import Tuple, Optional
-from urllib.parse import urlparse, parse_qs
+import functools
+import threading
+import time
+from typing import Dict, Tuple, Optional
+from urllib.parse import urlparse, parse_qs, unquote
 import requests
 
 # Configure logging
@@ -19,6 +23,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Per-row progress is logged once every N rows to keep the hot loop cheap
+PROGRESS_LOG_INTERVAL = 100
+
+# Coordinate patterns shared by the per-URL extractor and the vectorized fast path
+AT_COORDS_PATTERN = r'@(-?\d+(?:\.\d+)?),(-?\d+(?:\.\d+)?)'
+Q_COORDS_PATTERN = r'[?&]q=(-?\d+(?:\.\d+)?),(-?\d+(?:\.\d+)?)'
+
+# parse_coordinates_from_url patterns, compiled once at import
+_PAT_QUERY_ENCODED = re.compile(r'[?&]query=(-?\d+\.?\d*)%2C(-?\d+\.?\d*)', re.IGNORECASE)
+_PAT_AT = re.compile(AT_COORDS_PATTERN)
+_PAT_Q = re.compile(Q_COORDS_PATTERN)
+_PAT_PLACE = re.compile(r'/place/[^/]+/@(-?\d+(?:\.\d+)?),(-?\d+(?:\.\d+)?)')
+_PAT_PAIR = re.compile(r'(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)')
+
+# Retry policy for the per-row extraction loop
+MAX_ATTEMPTS = 3
+RETRY_DELAY = 2
+URL_TIMEOUT = 180  # 3 minutes timeout per attempt
+
+# Successfully resolved short URLs (short link -> final URL)
+_resolved_short_urls: Dict[str, str] = {}
+
+# Accepted column names (lowercase), in order of preference
+MAP_COLUMN_ALIASES = ('map link', 'maps link', 'maps', 'map', 'map links', 'maps links', 'map_link', 'maps_link', 'maplink', 'mapslink')
+LONG_COLUMN_ALIASES = ('long', 'longitude', 'lng')
+LAT_COLUMN_ALIASES = ('latts', 'latt', 'lat', 'latitude')
+
 
 def validate_coordinates(lng: float, lat: float) -> Tuple[Optional[float], Optional[float]]:
     """
@@ -31,17 +62,116 @@ def validate_coordinates(lng: float, lat: float) -> Tuple[Optional[float], Optio
     Returns:
         Tuple of (lng, lat) if valid, or (None, None) if invalid
     """
-    # Validate latitude range: -90 to 90
+    # Fast path: latitude -90 to 90 and longitude -180 to 180 (the common case)
+    if -90.0 <= lat <= 90.0 and -180.0 <= lng <= 180.0:
+        return lng, lat
+
+    log_invalid_coordinates(lng, lat)
+    return None, None
+
+
+def log_invalid_coordinates(lng: float, lat: float) -> None:
+    """Log why a coordinate pair failed validation (slow path of validate_coordinates)."""
     if not (-90.0 <= lat <= 90.0):
         logger.error(f"❌ Invalid latitude: {lat} (must be between -90 and 90)")
-        return None, None
-
-    # Validate longitude range: -180 to 180
-    if not (-180.0 <= lng <= 180.0):
+    else:
         logger.error(f"❌ Invalid longitude: {lng} (must be between -180 and 180)")
-        return None, None
 
-    return lng, lat
+
+def resolve_short_url(map_link: str) -> str:
+    """
+    Resolve a shortened URL (goo.gl or maps.app.goo.gl) to its final URL.
+
+    Successful resolutions are memoized so duplicate short links only hit the
+    network once; failures raise and are retried by the caller.
+
+    Args:
+        map_link: Shortened URL
+
+    Returns:
+        The URL after following redirects
+    """
+    resolved = _resolved_short_urls.get(map_link)
+    if resolved is None:
+        response = requests.head(map_link, allow_redirects=True, timeout=10)
+        resolved = _resolved_short_urls[map_link] = response.url
+    return resolved
+
+
+def decode_page(content: bytes, encoding: Optional[str] = None) -> str:
+    """
+    Decode a downloaded page body the way response.text does.
+
+    Streaming a response with iter_content consumes it, after which
+    response.text and response.apparent_encoding raise. Pass the bytes
+    already read plus response.encoding; without a declared encoding the
+    charset is detected from the bytes, as requests would.
+
+    Args:
+        content: Page body
+        encoding: Charset from the response headers, or None
+
+    Returns:
+        The page as text, undecodable bytes replaced
+    """
+    if encoding is None:
+        encoding = requests.compat.chardet.detect(content)['encoding']
+    try:
+        return str(content, encoding, errors='replace')
+    except (LookupError, TypeError):
+        return str(content, 'utf-8', errors='replace')
+
+
+def match_priority_pattern(
+    map_link: str,
+    combined: re.Pattern,
+    priority: Tuple[Tuple[str, re.Pattern, str], ...],
+) -> Optional[Tuple[str, float, float]]:
+    """
+    Find the coordinates the first matching pattern in priority order selects,
+    using one scan of a combined alternation.
+
+    Each entry of priority is (name, pattern, literal every match of the
+    pattern contains). combined joins the patterns in that order, each inside
+    a named group called name with its coordinates in name_lat and name_lng.
+
+    Links that can only match one pattern run that pattern alone. Otherwise
+    the alternation returns the leftmost hit; a higher-priority pattern can
+    only match to the right of it, so only the tail is re-checked.
+
+    Args:
+        map_link: URL to search
+        combined: Alternation of the priority patterns
+        priority: (name, pattern, literal) entries, highest priority first
+
+    Returns:
+        Tuple of (pattern name, lat, lng), or None if no pattern matched
+    """
+    candidates = [entry for entry in priority if entry[2] in map_link]
+    if not candidates:
+        return None
+    if len(candidates) == 1:
+        kind, pattern, _ = candidates[0]
+        match = pattern.search(map_link)
+        if not match:
+            return None
+        return kind, float(match.group(1)), float(match.group(2))
+
+    match = combined.search(map_link)
+    if not match:
+        return None
+
+    kind = match.lastgroup
+    for higher_kind, pattern, literal in priority:
+        if higher_kind == kind:
+            break
+        if literal not in map_link:
+            continue
+        higher = pattern.search(map_link, match.start() + 1)
+        if higher:
+            return higher_kind, float(higher.group(1)), float(higher.group(2))
+
+    return kind, float(match.group(f'{kind}_lat')), float(match.group(f'{kind}_lng'))
 
 
 def extract_coordinates_from_url(map_link: str) -> Tuple[Optional[float], Optional[float]]:
@@ -58,89 +188,187 @@ def extract_coordinates_from_url(map_link: str) -> Tuple[Optional[float], Option
         return None, None
     
     try:
-        # If it's a shortened URL (goo.gl or maps.app.goo.gl), resolve it first
-        if 'goo.gl' in map_link or 'maps.app.goo.gl' in map_link:
+        # If it's a shortened URL (goo.gl or maps.app.goo.gl), resolve it first.
+        # 'maps.app.goo.gl' contains 'goo.gl', so one substring scan covers both.
+        if 'goo.gl' in map_link:
             try:
-                response = requests.head(map_link, allow_redirects=True, timeout=10)
-                map_link = response.url
+                map_link = resolve_short_url(map_link)
                 logger.debug(f"Resolved shortened URL to: {map_link}")
             except Exception as e:
                 logger.warning(f"Failed to resolve shortened URL: {str(e)}")
-        
-        # Google Maps formats:
-        # 1. https://www.google.com/maps/place/Location/@-26.108204,28.0527061,17z
-        # 2. https://www.google.com/maps?q=-26.108204,28.0527061
-        # 3. https://maps.google.com/?q=-26.108204,28.0527061
-        # 4. https://www.google.com/maps/search/?api=1&query=47.5951518%2C-122.3316393
-        # 5. URLs with =en (language parameter)
-        # 6. https://goo.gl/maps/... (shortened, resolved above)
-
-        # Pattern 1: query=lat%2Clng format (URL-encoded comma)
-        # Example: ?api=1&query=47.5951518%2C-122.3316393
-        pattern_query_encoded = r'[?&]query=(-?\d+\.?\d*)%2C(-?\d+\.?\d*)'
-        match = re.search(pattern_query_encoded, map_link, re.IGNORECASE)
-        if match:
-            lat, lng = float(match.group(1)), float(match.group(2))
-            return validate_coordinates(lng, lat)
-
-        # BUG FIX #9: Make decimal points optional to support integer coordinates
-        # Pattern 2: @lat,lng format (supports @40,74 and @40.123,74.456)
-        pattern2 = r'@(-?\d+(?:\.\d+)?),(-?\d+(?:\.\d+)?)'
-        match = re.search(pattern2, map_link)
-        if match:
-            lat, lng = float(match.group(1)), float(match.group(2))
-            return validate_coordinates(lng, lat)
-
-        # Pattern 3: q=lat,lng format (supports q=40,74 and q=40.123,74.456)
-        pattern3 = r'[?&]q=(-?\d+(?:\.\d+)?),(-?\d+(?:\.\d+)?)'
-        match = re.search(pattern3, map_link)
-        if match:
-            lat, lng = float(match.group(1)), float(match.group(2))
-            return validate_coordinates(lng, lat)
-
-        # Pattern 4: /maps/place/.../@lat,lng (supports integer and decimal)
-        pattern4 = r'/place/[^/]+/@(-?\d+(?:\.\d+)?),(-?\d+(?:\.\d+)?)'
-        match = re.search(pattern4, map_link)
-        if match:
-            lat, lng = float(match.group(1)), float(match.group(2))
-            return validate_coordinates(lng, lat)
-
-        # Pattern 5: Direct coordinate pair in URL (supports integer and decimal)
-        # First decode URL-encoded characters
-        from urllib.parse import unquote
-        decoded_link = unquote(map_link)
-
-        pattern5 = r'(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)'
-        match = re.search(pattern5, decoded_link)
-        if match:
-            coord1, coord2 = float(match.group(1)), float(match.group(2))
-            # Determine which is lat and which is lng based on typical ranges
-            # Latitude: -90 to 90, Longitude: -180 to 180
-            if abs(coord1) <= 90 and abs(coord2) <= 180:
-                # coord1 is likely latitude
-                return validate_coordinates(coord2, coord1)
-            elif abs(coord2) <= 90 and abs(coord1) <= 180:
-                # coord2 is likely latitude
-                return validate_coordinates(coord1, coord2)
-            elif abs(coord1) <= 90:
-                # Only coord1 fits latitude range, coord2 must be longitude
-                return validate_coordinates(coord2, coord1)
-            elif abs(coord2) <= 90:
-                # Only coord2 fits latitude range, coord1 must be longitude
-                return validate_coordinates(coord1, coord2)
-            else:
-                # Both > 90, can't determine order - assume first is lat, second is lng
-                # This handles edge cases like (120.0, 150.0) in Eastern Asia/Pacific
-                return validate_coordinates(coord2, coord1)
-        
-        logger.warning(f"Could not extract coordinates from: {map_link}")
-        return None, None
-        
+
+        return parse_coordinates_from_url(map_link)
+
     except Exception as e:
         logger.error(f"Error extracting coordinates from {map_link}: {str(e)}")
         return None, None
 
 
+def _is_plain_number(text: str) -> bool:
+    """True for an optionally negative integer or decimal such as 40 or -26.108204"""
+    head, dot, tail = (text[1:] if text.startswith('-') else text).partition('.')
+    return head.isdecimal() and (not dot or tail.isdecimal())
+
+
+def scan_at_coordinates(map_link: str) -> Optional[Tuple[float, float]]:
+    """
+    Hand-parse the common '@lat,lng' case without running a regex.
+
+    Looks only at the first '@': the text up to the next comma must be the
+    latitude, and the text from there to the next ',' or '/' (or the end)
+    the longitude, both plain numbers.
+
+    Returns:
+        Tuple of (latitude, longitude), or None when the link has no such
+        pair and AT_COORDS_PATTERN has to decide
+    """
+    start = map_link.find('@') + 1
+    if not start:
+        return None
+    comma = map_link.find(',', start)
+    if comma < 0:
+        return None
+    end = len(map_link)
+    for stop in (',', '/'):
+        found = map_link.find(stop, comma + 1, end)
+        if found >= 0:
+            end = found
+    lat_text, lng_text = map_link[start:comma], map_link[comma + 1:end]
+    if _is_plain_number(lat_text) and _is_plain_number(lng_text):
+        return float(lat_text), float(lng_text)
+    return None
+
+
+@functools.lru_cache(maxsize=8192)
+def parse_coordinates_from_url(map_link: str) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Parse longitude and latitude from an already-resolved map link.
+
+    Pure function of the URL string, so results are memoized: sheets that
+    repeat the same link only pay for the regex work once.
+
+    Args:
+        map_link: URL string containing map location
+
+    Returns:
+        Tuple of (longitude, latitude) or (None, None) if no coordinates found
+    """
+    # Google Maps formats:
+    # 1. https://www.google.com/maps/place/Location/@-26.108204,28.0527061,17z
+    # 2. https://www.google.com/maps?q=-26.108204,28.0527061
+    # 3. https://maps.google.com/?q=-26.108204,28.0527061
+    # 4. https://www.google.com/maps/search/?api=1&query=47.5951518%2C-122.3316393
+    # 5. URLs with =en (language parameter)
+    # 6. https://goo.gl/maps/... (shortened, resolved above)
+
+    # Pattern 1: query=lat%2Clng format (URL-encoded comma)
+    # Example: ?api=1&query=47.5951518%2C-122.3316393
+    # ('%2' prefilter: every match contains it, in either case)
+    match = _PAT_QUERY_ENCODED.search(map_link) if '%2' in map_link else None
+    if match:
+        lat, lng = float(match.group(1)), float(match.group(2))
+        return validate_coordinates(lng, lat)
+
+    # BUG FIX #9: Make decimal points optional to support integer coordinates
+    # Pattern 2: @lat,lng format (supports @40,74 and @40.123,74.456)
+    coords = scan_at_coordinates(map_link)
+    if coords is not None:
+        lat, lng = coords
+        return validate_coordinates(lng, lat)
+    match = _PAT_AT.search(map_link) if '@' in map_link else None
+    if match:
+        lat, lng = float(match.group(1)), float(match.group(2))
+        return validate_coordinates(lng, lat)
+
+    # Pattern 3: q=lat,lng format (supports q=40,74 and q=40.123,74.456)
+    match = _PAT_Q.search(map_link)
+    if match:
+        lat, lng = float(match.group(1)), float(match.group(2))
+        return validate_coordinates(lng, lat)
+
+    # Pattern 4: /maps/place/.../@lat,lng (supports integer and decimal)
+    match = _PAT_PLACE.search(map_link)
+    if match:
+        lat, lng = float(match.group(1)), float(match.group(2))
+        return validate_coordinates(lng, lat)
+
+    # Pattern 5: Direct coordinate pair in URL (supports integer and decimal)
+    # First decode URL-encoded characters
+    decoded_link = unquote(map_link)
+
+    match = _PAT_PAIR.search(decoded_link)
+    if match:
+        coord1, coord2 = float(match.group(1)), float(match.group(2))
+        a1, a2 = abs(coord1), abs(coord2)
+        # Determine which is lat and which is lng based on typical ranges
+        # Latitude: -90 to 90, Longitude: -180 to 180
+        # - coord1 fits latitude: coord1 is latitude (validation rejects coord2 > 180)
+        # - only coord2 fits latitude: coord2 is latitude
+        # - both > 90, can't determine order: assume first is lat, second is lng
+        #   (validation then rejects it, e.g. (120.0, 150.0))
+        if a1 <= 90 or a2 > 90:
+            return validate_coordinates(coord2, coord1)
+        return validate_coordinates(coord1, coord2)
+    
+    logger.warning(f"Could not extract coordinates from: {map_link}")
+    return None, None
+
+
+def extract_coordinates_vectorized(links: pd.Series) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Extract @lat,lng and q=lat,lng coordinates for a whole column at once.
+
+    Mirrors the pattern priority of extract_coordinates_from_url (@ before q=)
+    and only accepts rows the per-URL extractor would resolve the same way.
+
+    Args:
+        links: Column of map links
+
+    Returns:
+        Tuple of (longitudes, latitudes, mask) as positional arrays; mask marks
+        rows whose coordinates were extracted and passed range validation
+    """
+    links = links.astype(str)
+    coords = links.str.extract(AT_COORDS_PATTERN).combine_first(links.str.extract(Q_COORDS_PATTERN))
+    lat = pd.to_numeric(coords[0], errors='coerce').to_numpy(dtype=float)
+    lng = pd.to_numeric(coords[1], errors='coerce').to_numpy(dtype=float)
+
+    eligible = ~(links.str.contains('query=', case=False, regex=False) | links.str.contains('goo.gl', regex=False)).to_numpy()
+    in_range = (np.abs(lat) <= 90.0) & (np.abs(lng) <= 180.0)
+    return lng, lat, eligible & in_range
+
+
+def extract_with_timeout(url: str, timeout: float) -> Tuple[Optional[float], Optional[float], Optional[str]]:
+    """
+    Cross-platform timeout wrapper around extract_coordinates_from_url using threading.
+
+    Args:
+        url: Map link to extract coordinates from
+        timeout: Maximum seconds to wait for the extraction
+
+    Returns:
+        Tuple of (longitude, latitude, error); error is None on completion
+    """
+    result = {'lng': None, 'lat': None, 'error': None}
+
+    def worker():
+        try:
+            result['lng'], result['lat'] = extract_coordinates_from_url(url)
+        except Exception as e:
+            result['error'] = str(e)
+
+    thread = threading.Thread(target=worker)
+    thread.daemon = True
+    thread.start()
+    thread.join(timeout=timeout)
+
+    if thread.is_alive():
+        # Thread still running = timeout
+        result['error'] = f"Timeout: URL took longer than {timeout} seconds to process"
+
+    return result['lng'], result['lat'], result['error']
+
+
 def process_excel_file(input_file: str, output_file: str) -> None:
     """
     Process Excel file and convert map links to coordinates.
@@ -161,13 +389,7 @@ def process_excel_file(input_file: str, output_file: str) -> None:
         column_mapping = {col.lower(): col for col in df.columns}
 
         # Validate required map column (case-insensitive, flexible names)
-        map_column = None
-        map_column_options = ['map link', 'maps link', 'maps', 'map', 'map links', 'maps links', 'map_link', 'maps_link', 'maplink', 'mapslink']
-
-        for option in map_column_options:
-            if option in column_mapping:
-                map_column = column_mapping[option]
-                break
+        map_column = next((column_mapping[a] for a in MAP_COLUMN_ALIASES if a in column_mapping), None)
 
         if not map_column:
             actual_columns = ', '.join(f'"{col}"' for col in df.columns)
@@ -188,24 +410,16 @@ def process_excel_file(input_file: str, output_file: str) -> None:
         # The column_mapping already maps lowercase keys to actual column names
         # So 'long' maps to 'LONG' if that's what the user has
 
-        # Try to find existing Long column
-        long_column = None
-        for option in ['long', 'longitude', 'lng']:
-            if option in column_mapping:
-                long_column = column_mapping[option]  # Returns actual column name (e.g., 'LONG')
-                break
+        # Try to find existing Long column (returns actual column name, e.g. 'LONG')
+        long_column = next((column_mapping[a] for a in LONG_COLUMN_ALIASES if a in column_mapping), None)
 
         # If not found, create new column with default name 'LONG'
         if not long_column:
             long_column = 'LONG'
             df[long_column] = None
 
-        # Try to find existing Lat column
-        lat_column = None
-        for option in ['latts', 'latt', 'lat', 'latitude']:
-            if option in column_mapping:
-                lat_column = column_mapping[option]  # Returns actual column name (e.g., 'LATTs')
-                break
+        # Try to find existing Lat column (returns actual column name, e.g. 'LATTs')
+        lat_column = next((column_mapping[a] for a in LAT_COLUMN_ALIASES if a in column_mapping), None)
 
         # If not found, create new column with default name 'LATTs'
         if not lat_column:
@@ -224,55 +438,49 @@ def process_excel_file(input_file: str, output_file: str) -> None:
         logger.info(f"🚀 Starting processing: {total_rows} rows")
         logger.info(f"{'='*60}")
 
+        # Vectorized fast path: extract plain @lat,lng and q=lat,lng links for the
+        # whole column in one pass. Links containing query= (checked first by the
+        # extractor) or shortened URLs (need network resolution) stay on the slow path.
+        fast_lng, fast_lat, fast_ok = extract_coordinates_vectorized(df[map_column])
+        logger.info(f"⚡ Fast path extracted coordinates for {int(fast_ok.sum())}/{total_rows} rows")
+
+        # Rows with missing or blank map links, computed once for the whole column
+        missing = (df[map_column].isna() | (df[map_column].fillna('').astype(str).str.strip() == '')).to_numpy()
+
+        # Comments are collected in a list and assigned to the column once after
+        # the loop; identical failure messages share a single string object
+        comments = df['Comments'].tolist()
+        failure_comments: Dict[Optional[str], str] = {}
+
         # Process each row with retry logic
         for idx, row in df.iterrows():
             map_link = row[map_column]
             row_name = row.get(name_column, f"Row {idx + 1}")
 
-            # Calculate and display progress
-            progress = ((idx + 1) / total_rows) * 100
-            logger.info(f"📍 Processing row {idx + 1}/{total_rows} ({progress:.1f}%) - {row_name}")
+            # Display progress every PROGRESS_LOG_INTERVAL rows (and on the last row)
+            if logger.isEnabledFor(logging.INFO) and (idx % PROGRESS_LOG_INTERVAL == 0 or idx + 1 == total_rows):
+                progress = ((idx + 1) / total_rows) * 100
+                logger.info("📍 Processing row %d/%d (%.1f%%) - %s", idx + 1, total_rows, progress, row_name)
 
             # Skip rows with missing or empty map links (blank output)
-            if pd.isna(map_link) or str(map_link).strip() == '':
-                df.at[idx, 'Comments'] = 'Skipped: No map link provided'
-                logger.warning(f"   ⏭️  Skipped: No map link provided")
+            if missing[idx]:
+                comments[idx] = 'Skipped: No map link provided'
+                logger.warning("   ⏭️  Skipped: No map link provided")
                 # LONG and LATTs remain blank (NaN) - no modification
                 continue
 
-            # Retry logic: Try up to 3 times with 2 second delay
-            MAX_ATTEMPTS = 3
-            RETRY_DELAY = 2
-            URL_TIMEOUT = 180  # 3 minutes timeout per attempt
+            if fast_ok[idx]:
+                df.at[idx, long_column] = fast_lng[idx]
+                df.at[idx, lat_column] = fast_lat[idx]
+                comments[idx] = 'Success'
+                continue
+
+            # Retry logic: Try up to MAX_ATTEMPTS times with RETRY_DELAY seconds between
             lng, lat = None, None
             last_error = None
 
-            import time
-            import threading
-
-            def extract_with_timeout(url, timeout):
-                """Cross-platform timeout wrapper using threading."""
-                result = {'lng': None, 'lat': None, 'error': None}
-
-                def worker():
-                    try:
-                        result['lng'], result['lat'] = extract_coordinates_from_url(url)
-                    except Exception as e:
-                        result['error'] = str(e)
-
-                thread = threading.Thread(target=worker)
-                thread.daemon = True
-                thread.start()
-                thread.join(timeout=timeout)
-
-                if thread.is_alive():
-                    # Thread still running = timeout
-                    result['error'] = f"Timeout: URL took longer than {timeout} seconds to process"
-
-                return result['lng'], result['lat'], result['error']
-
             for attempt in range(1, MAX_ATTEMPTS + 1):
-                logger.info(f"   🔄 Attempt {attempt}/{MAX_ATTEMPTS}: Extracting coordinates...")
+                logger.debug("   🔄 Attempt %d/%d: Extracting coordinates...", attempt, MAX_ATTEMPTS)
 
                 try:
                     lng, lat, error = extract_with_timeout(str(map_link), URL_TIMEOUT)
@@ -280,48 +488,50 @@ def process_excel_file(input_file: str, output_file: str) -> None:
                     if error:
                         last_error = error
                         if "Timeout" in error:
-                            logger.error(f"   ⏱️  Attempt {attempt} timeout: {last_error}")
+                            logger.error("   ⏱️  Attempt %d timeout: %s", attempt, last_error)
                         else:
-                            logger.error(f"   ❌ Attempt {attempt} error: {last_error}")
+                            logger.error("   ❌ Attempt %d error: %s", attempt, last_error)
 
                         if attempt < MAX_ATTEMPTS:
-                            logger.info(f"   ⏳ Waiting {RETRY_DELAY} seconds before retry...")
+                            logger.info("   ⏳ Waiting %d seconds before retry...", RETRY_DELAY)
                             time.sleep(RETRY_DELAY)
                         continue
 
                     if lng is not None and lat is not None:
-                        logger.info(f"   ✅ Success on attempt {attempt}: Lng={lng:.4f}, Lat={lat:.4f}")
+                        logger.debug("   ✅ Success on attempt %d: Lng=%.4f, Lat=%.4f", attempt, lng, lat)
                         break
                     else:
                         last_error = "Could not extract coordinates from URL"
-                        logger.warning(f"   ⚠️  Attempt {attempt} failed: {last_error}")
+                        logger.warning("   ⚠️  Attempt %d failed: %s", attempt, last_error)
 
                         if attempt < MAX_ATTEMPTS:
-                            logger.info(f"   ⏳ Waiting {RETRY_DELAY} seconds before retry...")
+                            logger.info("   ⏳ Waiting %d seconds before retry...", RETRY_DELAY)
                             time.sleep(RETRY_DELAY)
 
                 except Exception as e:
                     last_error = str(e)
-                    logger.error(f"   ❌ Attempt {attempt} error: {last_error}")
+                    logger.error("   ❌ Attempt %d error: %s", attempt, last_error)
 
                     if attempt < MAX_ATTEMPTS:
-                        logger.info(f"   ⏳ Waiting {RETRY_DELAY} seconds before retry...")
+                        logger.info("   ⏳ Waiting %d seconds before retry...", RETRY_DELAY)
                         time.sleep(RETRY_DELAY)
 
             # Record results
             if lng is not None and lat is not None:
                 df.at[idx, long_column] = lng
                 df.at[idx, lat_column] = lat
-                df.at[idx, 'Comments'] = 'Success'
-                logger.info(f"Row {idx + 1} ({row_name}): Extracted coordinates - Lng: {lng}, Lat: {lat}")
+                comments[idx] = 'Success'
+                logger.debug("Row %d (%s): Extracted coordinates - Lng: %s, Lat: %s", idx + 1, row_name, lng, lat)
             else:
-                comment = f"Failed after {MAX_ATTEMPTS} attempts: {last_error}"
-                df.at[idx, 'Comments'] = comment
-                logger.warning(f"   ❌ Failed after {MAX_ATTEMPTS} attempts")
+                comment = failure_comments.get(last_error)
+                if comment is None:
+                    comment = failure_comments[last_error] = f"Failed after {MAX_ATTEMPTS} attempts: {last_error}"
+                comments[idx] = comment
+                logger.warning("   ❌ Row %d (%s): Failed after %d attempts", idx + 1, row_name, MAX_ATTEMPTS)
                 # LONG and LATTs remain blank (NaN) - no modification
 
-            logger.info("")  # Blank line between rows
-        
+        df['Comments'] = comments
+
         # Save to output file
         logger.info(f"Saving output file: {output_file}")
         df.to_excel(output_file, index=False)
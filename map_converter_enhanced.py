@@ -4,15 +4,24 @@ Enhanced Map Link to Coordinates Converter
 Supports 4 fallback methods for extracting coordinates
 """
 
+import numpy as np
+import functools
+import glob
+import os
 import pandas as pd
 import re
 import sys
 import logging
-from typing import Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from urllib.parse import urlparse, parse_qs, unquote
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from map_converter import decode_page, match_priority_pattern
 
 # Configure logging
 logging.basicConfig(
@@ -21,6 +30,68 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Method 1 patterns, compiled once at import
+_PAT_QUERY_ENCODED = re.compile(r'[?&]query=(-?\d+\.?\d*)%2C(-?\d+\.?\d*)', re.IGNORECASE)
+_PAT_AT = re.compile(r'@(-?\d+\.\d+),(-?\d+\.\d+),?\d*z?')
+_PAT_Q = re.compile(r'[?&]q=(-?\d+\.\d+),(-?\d+\.\d+)')
+_PAT_PAIR = re.compile(r'(-?\d+\.\d+)\s*,\s*(-?\d+\.\d+)')
+
+# Patterns 1-3 as one alternation, and their priority table, for match_priority_pattern
+_PAT_COMBINED = re.compile(
+    r'(?P<qe>(?i:[?&]query=(?P<qe_lat>-?\d+\.?\d*)%2C(?P<qe_lng>-?\d+\.?\d*)))'
+    r'|(?P<at>@(?P<at_lat>-?\d+\.\d+),(?P<at_lng>-?\d+\.\d+),?\d*z?)'
+    r'|(?P<q>[?&]q=(?P<q_lat>-?\d+\.\d+),(?P<q_lng>-?\d+\.\d+))'
+)
+_COMBINED_PRIORITY = (('qe', _PAT_QUERY_ENCODED, '%2'), ('at', _PAT_AT, '@'), ('q', _PAT_Q, 'q='))
+
+# Progress is logged every N links or after this many seconds, whichever
+# comes first, instead of once per row
+PROGRESS_LOG_INTERVAL = 100
+PROGRESS_LOG_SECONDS = 1.0
+
+# Concurrent fallback chains (Methods 2-4 mostly wait on the network)
+FALLBACK_WORKERS = 32
+
+# Name endings of the files process_batch writes (see write_output_files), so
+# a pattern that also matches the output directory doesn't read them back
+BATCH_OUTPUT_SUFFIXES = ('_processed', '_processed_failed', '_processed_skipped')
+
+# Pattern 5 decodes every link patterns 1-3 missed. Failed links are not in
+# the extraction cache and get decoded again on each retry, so memoize it
+_unquote_cached = functools.lru_cache(maxsize=2048)(unquote)
+
+# Hosts Method 2 follows redirects for: shorteners (maps.app.goo.gl is
+# covered by goo.gl) and regional Google domains
+_REDIRECT_HOSTS = re.compile(r'goo\.gl|google\.co\.za|google\.com\.au')
+
+# One connection pool shared by Methods 2-4 and all fallback workers, so
+# repeated requests to the same host reuse open (TLS) connections.
+# Transient failures (connection errors, rate limiting, 5xx) are retried
+# with backoff; the last response is returned once retries run out.
+_retry = Retry(total=2, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False)
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=FALLBACK_WORKERS, pool_maxsize=FALLBACK_WORKERS, max_retries=_retry)
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
+
+# Method 3 downloads pages in chunks and stops at the first '@lat,lng' hit;
+# the overlap keeps a hit split across two chunks findable
+HTML_CHUNK_SIZE = 65536
+HTML_CHUNK_OVERLAP = 256
+_HTML_AT = re.compile(rb'@(-?\d+\.\d+),(-?\d+\.\d+)')
+# Map centre in the page's inline JSON, searched in the raw bytes too
+_HTML_JSON_CENTER = re.compile(rb'"center":\{"lat":(-?\d+\.\d+),"lng":(-?\d+\.\d+)\}')
+
+# Method 4 query extraction from query= / /place/ / /search/ URLs
+_M4_QUERY = re.compile(r'[?&]query=([^&]+)')
+_M4_COORDS_ONLY = re.compile(r'^-?\d+\.?\d*,-?\d+\.?\d*$')
+_M4_PLACE = re.compile(r'/place/([^/@]+)')
+_M4_SEARCH = re.compile(r'/search/([^/@]+)')
+
+# Successful extractions (map link -> (lng, lat)); failures are not cached
+# since Methods 2-4 can fail on transient network errors
+_extracted_coordinates: Dict[str, Tuple[float, float]] = {}
+
 
 def validate_coordinates(lng: float, lat: float) -> Tuple[Optional[float], Optional[float]]:
     """
@@ -40,6 +111,44 @@ def validate_coordinates(lng: float, lat: float) -> Tuple[Optional[float], Optio
     return lng, lat
 
 
+def method1_vectorized_extraction(links: pd.Series) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Run Method 1 patterns 1-3 over a whole column with one str.extract pass.
+
+    A row is only accepted when its leftmost hit is the pattern
+    method1_regex_extraction would pick (no literal of a higher-priority
+    pattern in the link) and the coordinates are in range. Everything else
+    is left to the per-row fallback chain.
+
+    Returns:
+        Tuple of (lng, lat, resolved mask) arrays aligned with links;
+        lng/lat are NaN wherever the mask is False
+    """
+    links = links.astype(str)
+    # Every alternative needs '@' or '=': only run the regex on rows with one
+    has_at = links.str.contains('@', regex=False)
+    candidates = has_at | links.str.contains('=', regex=False)
+    found = links[candidates].str.extract(_PAT_COMBINED).reindex(links.index)
+
+    is_qe = found['qe'].notna()
+    is_at = found['at'].notna()
+    is_q = found['q'].notna()
+    has_encoded = links.str.contains('%2', regex=False)
+    unambiguous = is_qe | (is_at & ~has_encoded) | (is_q & ~has_encoded & ~has_at)
+
+    # \d also matches non-ASCII digits, which to_numeric can't parse: those
+    # rows become NaN here and go to the per-row chain, where float() can
+    lat = pd.to_numeric(found['qe_lat'].fillna(found['at_lat']).fillna(found['q_lat']), errors='coerce').to_numpy(dtype=float)
+    lng = pd.to_numeric(found['qe_lng'].fillna(found['at_lng']).fillna(found['q_lng']), errors='coerce').to_numpy(dtype=float)
+
+    # Same bounds as validate_coordinates, checked for the whole column at
+    # once (NaN compares False, so unmatched rows are never valid)
+    resolved = unambiguous.to_numpy() & (np.abs(lat) <= 90.0) & (np.abs(lng) <= 180.0)
+    lat[~resolved] = np.nan
+    lng[~resolved] = np.nan
+    return lng, lat, resolved
+
+
 def method1_regex_extraction(map_link: str) -> Tuple[Optional[float], Optional[float]]:
     """
     METHOD 1: Direct regex pattern matching (fastest, most reliable)
@@ -57,46 +166,20 @@ def method1_regex_extraction(map_link: str) -> Tuple[Optional[float], Optional[f
         return None, None
 
     try:
-        # Pattern 1: query=lat%2Clng format (URL-encoded comma)
-        # Example: ?api=1&query=47.5951518%2C-122.3316393
-        pattern_query_encoded = r'[?&]query=(-?\d+\.?\d*)%2C(-?\d+\.?\d*)'
-        match = re.search(pattern_query_encoded, map_link, re.IGNORECASE)
-        if match:
-            lat, lng = float(match.group(1)), float(match.group(2))
-            logger.debug(f"✅ Method 1 (Pattern Query Encoded): Found coordinates query={lat}%2C{lng}")
-            return validate_coordinates(lng, lat)
-
-        # Pattern 2: @lat,lng,zoom format (including search URLs)
-        pattern2 = r'@(-?\d+\.\d+),(-?\d+\.\d+),?\d*z?'
-        match = re.search(pattern2, map_link)
-        if match:
-            lat, lng = float(match.group(1)), float(match.group(2))
-            logger.debug(f"✅ Method 1 (Pattern 2): Found coordinates @{lat},{lng}")
-            return validate_coordinates(lng, lat)
-
-        # Pattern 3: q=lat,lng format
-        pattern3 = r'[?&]q=(-?\d+\.\d+),(-?\d+\.\d+)'
-        match = re.search(pattern3, map_link)
-        if match:
-            lat, lng = float(match.group(1)), float(match.group(2))
-            logger.debug(f"✅ Method 1 (Pattern 3): Found coordinates q={lat},{lng}")
-            return validate_coordinates(lng, lat)
-
-        # Pattern 4: /place/.../@lat,lng
-        pattern4 = r'/place/[^/]+/@(-?\d+\.\d+),(-?\d+\.\d+)'
-        match = re.search(pattern4, map_link)
-        if match:
-            lat, lng = float(match.group(1)), float(match.group(2))
-            logger.debug(f"✅ Method 1 (Pattern 4): Found coordinates in place URL")
+        # Patterns 1-3 in one scan, in priority order:
+        # 1. query=lat%2Clng format (URL-encoded comma), e.g. ?api=1&query=47.5951518%2C-122.3316393
+        # 2. @lat,lng,zoom format (including search and /place/.../@lat,lng URLs)
+        # 3. q=lat,lng format
+        found = match_priority_pattern(map_link, _PAT_COMBINED, _COMBINED_PRIORITY)
+        if found:
+            kind, lat, lng = found
+            logger.debug(f"✅ Method 1 (Pattern {kind}): Found coordinates {lat},{lng}")
             return validate_coordinates(lng, lat)
 
         # Pattern 5: Direct coordinate pair (with or without URL encoding)
         # First decode URL-encoded characters
-        from urllib.parse import unquote
-        decoded_link = unquote(map_link)
-
-        pattern5 = r'(-?\d+\.\d+)\s*,\s*(-?\d+\.\d+)'
-        match = re.search(pattern5, decoded_link)
+        decoded_link = _unquote_cached(map_link)
+        match = _PAT_PAIR.search(decoded_link) if ',' in decoded_link else None
         if match:
             coord1, coord2 = float(match.group(1)), float(match.group(2))
             # Determine which is lat vs lng based on ranges
@@ -124,11 +207,11 @@ def method2_url_resolution(map_link: str, timeout=10) -> Tuple[Optional[float],
     """
     try:
         # Check if it's a shortened or regional URL
-        if any(domain in map_link for domain in ['goo.gl', 'maps.app.goo.gl', 'google.co.za', 'google.com.au']):
+        if _REDIRECT_HOSTS.search(map_link):
             logger.info(f"🔄 Method 2: Resolving shortened/regional URL...")
 
             # Follow redirects to get final URL
-            response = requests.head(map_link, allow_redirects=True, timeout=timeout)
+            response = _session.head(map_link, allow_redirects=True, timeout=timeout)
             resolved_url = response.url
 
             if resolved_url != map_link:
@@ -159,27 +242,40 @@ def method3_html_scraping(map_link: str, timeout=15) -> Tuple[Optional[float], O
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
 
-        response = requests.get(map_link, headers=headers, timeout=timeout, allow_redirects=True)
+        with _session.get(map_link, headers=headers, timeout=timeout, allow_redirects=True, stream=True) as response:
+            if response.status_code != 200:
+                return None, None
 
-        if response.status_code == 200:
-            html_content = response.text
+            # Pattern 1: Look for coordinates in URL within HTML, scanning the
+            # page while it downloads
+            chunks = []
+            window = b''
+            for chunk in response.iter_content(chunk_size=HTML_CHUNK_SIZE):
+                chunks.append(chunk)
+                window = window[-HTML_CHUNK_OVERLAP:] + chunk
+                coords_in_html = _HTML_AT.search(window)
+                # A hit touching the end of the window may continue in the next chunk
+                if coords_in_html and coords_in_html.end() < len(window):
+                    break
+            else:
+                content = b''.join(chunks)
+                coords_in_html = _HTML_AT.search(content)
 
-            # Try to find coordinates in HTML
-            # Pattern 1: Look for coordinates in URL within HTML
-            coords_in_html = re.search(r'@(-?\d+\.\d+),(-?\d+\.\d+)', html_content)
             if coords_in_html:
                 lat, lng = float(coords_in_html.group(1)), float(coords_in_html.group(2))
                 logger.info(f"✅ Method 3: Found coordinates in HTML: {lat},{lng}")
                 return validate_coordinates(lng, lat)
 
             # Pattern 2: Look for JSON data with coordinates
-            json_pattern = r'"center":\{"lat":(-?\d+\.\d+),"lng":(-?\d+\.\d+)\}'
-            json_match = re.search(json_pattern, html_content)
+            json_match = _HTML_JSON_CENTER.search(content)
             if json_match:
                 lat, lng = float(json_match.group(1)), float(json_match.group(2))
                 logger.info(f"✅ Method 3: Found coordinates in JSON: {lat},{lng}")
                 return validate_coordinates(lng, lat)
 
+            # Only the meta-tag parse needs the page as text
+            html_content = decode_page(content, response.encoding)
+
             # Pattern 3: Look for meta tags
             soup = BeautifulSoup(html_content, 'html.parser')
 
@@ -213,7 +309,6 @@ def method4_google_places_api(map_link: str, api_key: Optional[str] = None) -> T
     """
     try:
         if not api_key:
-            import os
             api_key = os.environ.get('GOOGLE_MAPS_API_KEY')
 
         if not api_key:
@@ -226,23 +321,23 @@ def method4_google_places_api(map_link: str, api_key: Optional[str] = None) -> T
         query = None
 
         # Try to extract from query= parameter (place name searches)
-        query_match = re.search(r'[?&]query=([^&]+)', map_link)
+        query_match = _M4_QUERY.search(map_link)
         if query_match:
             query = unquote(query_match.group(1)).replace('+', ' ')
             # Skip if it's coordinates (already handled by Method 1)
-            if re.match(r'^-?\d+\.?\d*,-?\d+\.?\d*$', query):
+            if _M4_COORDS_ONLY.match(query):
                 logger.debug("Method 4: Skipped (query contains coordinates, already extracted)")
                 return None, None
 
         # Try to extract from place name in URL
         if not query:
-            place_match = re.search(r'/place/([^/@]+)', map_link)
+            place_match = _M4_PLACE.search(map_link)
             if place_match:
                 query = unquote(place_match.group(1)).replace('+', ' ')
 
         # Try to extract from search term
         if not query:
-            search_match = re.search(r'/search/([^/@]+)', map_link)
+            search_match = _M4_SEARCH.search(map_link)
             if search_match:
                 query = unquote(search_match.group(1)).replace('+', ' ')
 
@@ -259,7 +354,7 @@ def method4_google_places_api(map_link: str, api_key: Optional[str] = None) -> T
             'key': api_key
         }
 
-        response = requests.get(places_url, params=params, timeout=10)
+        response = _session.get(places_url, params=params, timeout=10)
         data = response.json()
 
         if data.get('status') == 'OK' and data.get('results'):
@@ -301,40 +396,88 @@ def extract_coordinates_from_url(map_link: str) -> Tuple[Optional[float], Option
     if not map_link or not isinstance(map_link, str):
         return None, None
 
-    logger.info(f"🔍 Extracting coordinates from: {map_link[:80]}...")
+    cached = _extracted_coordinates.get(map_link)
+    if cached is not None:
+        logger.debug("✅ Reusing coordinates for repeated link: %.6f, %.6f", *cached)
+        return cached
+
+    lng, lat = _extract_with_fallbacks(map_link)
+    if lng is not None and lat is not None:
+        _extracted_coordinates[map_link] = (lng, lat)
+    return lng, lat
+
+
+def _extract_with_fallbacks(map_link: str) -> Tuple[Optional[float], Optional[float]]:
+    """Run the 4 extraction methods in order, returning the first success."""
+    logger.debug("🔍 Extracting coordinates from: %s...", map_link[:80])
 
     # METHOD 1: Direct regex extraction (fastest)
     lng, lat = method1_regex_extraction(map_link)
     if lng is not None and lat is not None:
-        logger.info(f"✅ Success with Method 1 (Regex): {lng:.6f}, {lat:.6f}")
+        logger.debug("✅ Success with Method 1 (Regex): %.6f, %.6f", lng, lat)
         return lng, lat
 
     # METHOD 2: URL resolution for shortened URLs
     lng, lat = method2_url_resolution(map_link)
     if lng is not None and lat is not None:
-        logger.info(f"✅ Success with Method 2 (URL Resolution): {lng:.6f}, {lat:.6f}")
+        logger.debug("✅ Success with Method 2 (URL Resolution): %.6f, %.6f", lng, lat)
         return lng, lat
 
     # METHOD 3: HTML scraping
     lng, lat = method3_html_scraping(map_link)
     if lng is not None and lat is not None:
-        logger.info(f"✅ Success with Method 3 (HTML Scraping): {lng:.6f}, {lat:.6f}")
+        logger.debug("✅ Success with Method 3 (HTML Scraping): %.6f, %.6f", lng, lat)
         return lng, lat
 
     # METHOD 4: Google Places API Text Search (requires API key)
     lng, lat = method4_google_places_api(map_link)
     if lng is not None and lat is not None:
-        logger.info(f"✅ Success with Method 4 (Google Places API): {lng:.6f}, {lat:.6f}")
+        logger.debug("✅ Success with Method 4 (Google Places API): %.6f, %.6f", lng, lat)
         return lng, lat
 
     logger.warning(f"❌ All 4 methods failed to extract coordinates from: {map_link[:80]}...")
     return None, None
 
 
-def process_excel_file(input_file: str, output_file: str) -> None:
+def write_output_files(df: pd.DataFrame, output_file: str, failed_rows: List[int], skipped_rows: List[int]) -> None:
+    """
+    Save the processed sheet plus separate files for failed and skipped rows
+    (<name>_failed.xlsx / <name>_skipped.xlsx next to the output file).
+    """
+    logger.info(f"Saving output file: {output_file}")
+    df.to_excel(output_file, index=False)
+
+    output_path = Path(output_file)
+    output_stem = output_path.stem
+    output_dir = output_path.parent
+    output_ext = output_path.suffix
+
+    if failed_rows:
+        failed_df = df.iloc[failed_rows]
+        failed_file = output_dir / f"{output_stem}_failed{output_ext}"
+        failed_df.to_excel(failed_file, index=False)
+        logger.info(f"✅ Saved {len(failed_df)} failed rows to: {failed_file}")
+    else:
+        logger.info("✅ No failed rows - skipping failed file")
+
+    if skipped_rows:
+        skipped_df = df.iloc[skipped_rows]
+        skipped_file = output_dir / f"{output_stem}_skipped{output_ext}"
+        skipped_df.to_excel(skipped_file, index=False)
+        logger.info(f"✅ Saved {len(skipped_df)} skipped rows to: {skipped_file}")
+    else:
+        logger.info("✅ No skipped rows - skipping skipped file")
+
+
+def process_excel_file(input_file: str, output_file: str,
+                       writer: Optional[ThreadPoolExecutor] = None) -> Optional[Future]:
     """
     Process Excel file and convert map links to coordinates.
     Uses enhanced extraction with 4 fallback methods.
+
+    If a writer executor is given, the output files are written on it and
+    the pending Future is returned, so the caller can start on the next
+    file while this one is saved. Otherwise they are written before returning.
     """
     try:
         logger.info(f"Reading input file: {input_file}")
@@ -385,87 +528,146 @@ def process_excel_file(input_file: str, output_file: str) -> None:
         logger.info(f"🚀 Starting processing: {total_rows} rows")
         logger.info(f"{'='*60}")
 
-        successful = 0
-        failed = 0
-        skipped = 0
-
-        for idx, row in df.iterrows():
-            map_link = row[map_column]
-            row_name = row.get(name_column, f"Row {idx + 1}")
-            progress = ((idx + 1) / total_rows) * 100
-
-            logger.info(f"📍 Processing row {idx + 1}/{total_rows} ({progress:.1f}%) - {row_name}")
+        # Results are gathered in plain arrays and written back as whole
+        # columns once every row is done (rows are positions: read_excel
+        # returns a RangeIndex)
+        map_links = df[map_column].tolist()
+        row_names = df[name_column].tolist() if name_column in df.columns else None
+        lngs = df[long_column].to_numpy(dtype=object, copy=True)
+        lats = df[lat_column].to_numpy(dtype=object, copy=True)
+        comments = df['Comments'].to_numpy(dtype=object, copy=True)
+
+        # Method 1 for every row in one vectorized pass; only the rows it
+        # cannot settle go through the per-row fallback chain below
+        fast_lng, fast_lat, resolved = method1_vectorized_extraction(df[map_column])
+        lngs[resolved] = fast_lng[resolved]
+        lats[resolved] = fast_lat[resolved]
+        comments[resolved] = 'Success'
+
+        successful = int(resolved.sum())
+        failed_rows = []
+        skipped_rows = []
+        logger.info(f"⚡ Method 1 (vectorized): {successful}/{total_rows} rows resolved")
+
+        pending = []
+        for idx in np.flatnonzero(~resolved):
+            map_link = map_links[idx]
 
             # Skip blank map links
             if pd.isna(map_link) or str(map_link).strip() == '':
-                df.at[idx, 'Comments'] = 'Skipped: No map link provided'
-                logger.warning(f"   ⏭️  Skipped: No map link provided")
-                skipped += 1
+                row_name = row_names[idx] if row_names is not None else f"Row {idx + 1}"
+                logger.warning(f"   ⏭️  Skipped row {idx + 1}/{total_rows} - {row_name}: No map link provided")
+                comments[idx] = 'Skipped: No map link provided'
+                skipped_rows.append(idx)
                 continue
 
-            # Extract coordinates with 4 fallback methods
-            lng, lat = extract_coordinates_from_url(str(map_link))
+            pending.append(idx)
+
+        # Run the fallback chain for each distinct remaining link on a thread
+        # pool, so the network waits of Methods 2-4 overlap
+        links = [str(map_links[idx]) for idx in pending]
+        unique_links = list(dict.fromkeys(links))
+        extracted = {}
+        if unique_links:
+            logger.info(f"🌐 Running fallback methods for {len(unique_links)} links ({FALLBACK_WORKERS} workers)")
+            last_log = time.monotonic()
+            with ThreadPoolExecutor(max_workers=FALLBACK_WORKERS) as executor:
+                results = executor.map(extract_coordinates_from_url, unique_links)
+                for done, (link, result) in enumerate(zip(unique_links, results), 1):
+                    extracted[link] = result
+                    now = time.monotonic()
+                    if done % PROGRESS_LOG_INTERVAL == 0 or done == len(unique_links) or now - last_log >= PROGRESS_LOG_SECONDS:
+                        progress = (done / len(unique_links)) * 100
+                        logger.info("📍 Fallback progress: %d/%d links (%.1f%%)", done, len(unique_links), progress)
+                        last_log = now
+
+        for idx, map_link in zip(pending, links):
+            lng, lat = extracted[map_link]
 
             if lng is not None and lat is not None:
-                df.at[idx, long_column] = lng
-                df.at[idx, lat_column] = lat
-                df.at[idx, 'Comments'] = 'Success'
+                lngs[idx] = lng
+                lats[idx] = lat
+                comments[idx] = 'Success'
                 successful += 1
-                logger.info(f"   ✅ Success: Lng={lng:.6f}, Lat={lat:.6f}")
+                logger.debug("   ✅ Row %d: Lng=%.6f, Lat=%.6f", idx + 1, lng, lat)
             else:
-                df.at[idx, 'Comments'] = 'Failed: Could not extract coordinates (tried 4 methods)'
-                failed += 1
-                logger.error(f"   ❌ Failed: All methods exhausted")
-
-            logger.info("")
+                comments[idx] = 'Failed: Could not extract coordinates (tried 4 methods)'
+                failed_rows.append(idx)
+                row_name = row_names[idx] if row_names is not None else f"Row {idx + 1}"
+                logger.error("   ❌ Row %d (%s): All methods exhausted", idx + 1, row_name)
 
-        # Save output
-        logger.info(f"Saving output file: {output_file}")
-        df.to_excel(output_file, index=False)
+        df[long_column] = lngs
+        df[lat_column] = lats
+        df['Comments'] = comments
 
         logger.info(f"{'='*60}")
         logger.info(f"✅ Processing complete!")
         logger.info(f"   Total: {total_rows} rows")
         logger.info(f"   ✅ Successful: {successful}")
-        logger.info(f"   ❌ Failed: {failed}")
-        logger.info(f"   ⏭️  Skipped: {skipped}")
+        logger.info(f"   ❌ Failed: {len(failed_rows)}")
+        logger.info(f"   ⏭️  Skipped: {len(skipped_rows)}")
         logger.info(f"{'='*60}")
 
-        # Generate separate files for failed and skipped rows
-        from pathlib import Path
-        output_path = Path(output_file)
-        output_stem = output_path.stem
-        output_dir = output_path.parent
-        output_ext = output_path.suffix
-
-        # Filter failed rows (rows with Comments starting with "Failed")
-        failed_df = df[df['Comments'].str.startswith('Failed', na=False)]
-        if len(failed_df) > 0:
-            failed_file = output_dir / f"{output_stem}_failed{output_ext}"
-            failed_df.to_excel(failed_file, index=False)
-            logger.info(f"✅ Saved {len(failed_df)} failed rows to: {failed_file}")
-        else:
-            logger.info("✅ No failed rows - skipping failed file")
-
-        # Filter skipped rows (rows with Comments starting with "Skipped")
-        skipped_df = df[df['Comments'].str.startswith('Skipped', na=False)]
-        if len(skipped_df) > 0:
-            skipped_file = output_dir / f"{output_stem}_skipped{output_ext}"
-            skipped_df.to_excel(skipped_file, index=False)
-            logger.info(f"✅ Saved {len(skipped_df)} skipped rows to: {skipped_file}")
-        else:
-            logger.info("✅ No skipped rows - skipping skipped file")
+        if writer is not None:
+            return writer.submit(write_output_files, df, output_file, failed_rows, skipped_rows)
+        write_output_files(df, output_file, failed_rows, skipped_rows)
+        return None
 
     except Exception as e:
         logger.error(f"Error processing file: {str(e)}")
         raise
 
 
+def process_batch(input_pattern: str, output_dir: str) -> None:
+    """
+    Process every Excel file matching a glob pattern into output_dir.
+
+    Each file is saved as <name>_processed.xlsx on a background writer
+    thread while the next file is being extracted. Files this function
+    wrote earlier are not read as inputs, and a batch in which two inputs
+    share a name (e.g. a/data.xlsx and b/data.xls) is refused before
+    anything is written.
+    """
+    input_files = [f for f in sorted(glob.glob(input_pattern))
+                   if not Path(f).stem.endswith(BATCH_OUTPUT_SUFFIXES)]
+    if not input_files:
+        raise ValueError(f"No input files match: {input_pattern}")
+
+    jobs = {}  # normalized output path -> (input file, output file)
+    for input_file in input_files:
+        output_file = os.path.join(output_dir, f"{Path(input_file).stem}_processed.xlsx")
+        key = os.path.normcase(output_file)
+        if key in jobs:
+            raise ValueError(f"{jobs[key][0]} and {input_file} would both be written to {output_file}")
+        jobs[key] = (input_file, output_file)
+
+    os.makedirs(output_dir, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        pending = []
+        for input_file, output_file in jobs.values():
+            pending.append(process_excel_file(input_file, output_file, writer=writer))
+
+        for future in pending:
+            future.result()
+
+    logger.info(f"✅ Batch complete: {len(input_files)} files written to {output_dir}")
+
+
 def main():
     """Main entry point."""
+    if len(sys.argv) == 4 and sys.argv[1] == 'batch':
+        try:
+            process_batch(sys.argv[2], sys.argv[3])
+        except Exception as e:
+            logger.error(f"Batch processing failed: {str(e)}")
+            sys.exit(1)
+        return
+
     if len(sys.argv) < 3:
         print("Usage: python map_converter_enhanced.py <input_excel_file> <output_excel_file>")
+        print("       python map_converter_enhanced.py batch '<input_glob>' <output_dir>")
         print("Example: python map_converter_enhanced.py input.xlsx output.xlsx")
+        print("Example: python map_converter_enhanced.py batch 'sheets/*.xlsx' processed/")
         sys.exit(1)
 
     input_file = sys.argv[1]
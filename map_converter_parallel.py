@@ -1,19 +1,40 @@
 #!/usr/bin/env python3
 """
 Parallel Map Link to Coordinates Converter
-Runs ALL 5 extraction methods in parallel and compares results
+Runs extraction methods 1-4 in parallel and compares results
+(method 5, Selenium, only when the others all fail)
 """
 
+import numpy as np
 import pandas as pd
 import re
 import sys
 import logging
-from typing import Tuple, Optional, Dict
+import atexit
+import html
+import threading
+import time
+from typing import Tuple, Optional, Dict, List
 from urllib.parse import urlparse, parse_qs, unquote
 import requests
-from bs4 import BeautifulSoup
-import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from map_converter import decode_page, match_priority_pattern
+
+# Selenium is only needed by Method 5; without it that method just fails
+try:
+    from selenium import webdriver
+    from selenium.common.exceptions import TimeoutException as SeleniumTimeoutException
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.support.ui import WebDriverWait
+    from webdriver_manager.chrome import ChromeDriverManager
+except ImportError:
+    webdriver = None
 
 # Configure logging
 logging.basicConfig(
@@ -22,6 +43,92 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# One connection pool shared by Methods 2-4, so requests to the same Google
+# hosts reuse open (TLS) connections; connection errors are retried twice
+_retry = Retry(total=2, backoff_factor=0.1)
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=_retry)
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
+
+# Shared Method 5 browser, started on first use (see _get_driver)
+_driver = None
+_driver_lock = threading.Lock()
+
+# Keys of the dict returned by extract_coordinates_parallel, in method order
+METHOD_NAMES = ('method1', 'method2', 'method3', 'method4', 'method5')
+
+# Accepted map column names (lowercase), in order of preference
+MAP_COLUMN_ALIASES = ('map link', 'maps link', 'maps', 'map', 'map links', 'maps links')
+
+# Headless Chrome flags for Method 5
+CHROME_ARGUMENTS = (
+    '--headless',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    'user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+)
+
+# Rows processed concurrently by process_excel_file (each row waits mostly
+# on the network)
+ROW_WORKERS = 16
+
+# Network lookups repeated across rows. Only answers the server actually gave
+# are kept (not timeouts or connection errors), so a transient failure is
+# retried on the next occurrence.
+_resolved_urls: Dict[str, str] = {}  # short/regional link -> redirect target
+_places_results: Dict[Tuple[str, str], Tuple[Optional[float], Optional[float]]] = {}  # (query, API key) -> (lng, lat)
+
+# Method 1 patterns, compiled once at import
+_PAT_QUERY_ENCODED = re.compile(r'[?&]query=(-?\d+\.?\d*)%2C(-?\d+\.?\d*)', re.IGNORECASE)
+_PAT_AT = re.compile(r'@(-?\d+(?:\.\d+)?),(-?\d+(?:\.\d+)?),?\d*z?')
+_PAT_Q = re.compile(r'[?&]q=(-?\d+(?:\.\d+)?),(-?\d+(?:\.\d+)?)')
+_PAT_PAIR = re.compile(r'(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)')
+
+# Patterns 1-3 as one alternation, and their priority table, for match_priority_pattern
+_PAT_COMBINED = re.compile(
+    r'(?P<qe>(?i:[?&]query=(?P<qe_lat>-?\d+\.?\d*)%2C(?P<qe_lng>-?\d+\.?\d*)))'
+    r'|(?P<at>@(?P<at_lat>-?\d+(?:\.\d+)?),(?P<at_lng>-?\d+(?:\.\d+)?),?\d*z?)'
+    r'|(?P<q>[?&]q=(?P<q_lat>-?\d+(?:\.\d+)?),(?P<q_lng>-?\d+(?:\.\d+)?))'
+)
+_COMBINED_PRIORITY = (('qe', _PAT_QUERY_ENCODED, '%2'), ('at', _PAT_AT, '@'), ('q', _PAT_Q, 'q='))
+
+# Method 5 pattern for the browser's current URL and page source
+_PAT_HTML_AT = re.compile(r'@(-?\d+\.\d+),(-?\d+\.\d+)')
+# Both Method 3 page patterns in one pass over the raw HTML bytes
+_PAT_HTML_COORDS = re.compile(
+    rb'@(?P<at_lat>-?\d+\.\d+),(?P<at_lng>-?\d+\.\d+)'
+    rb'|"center":\{"lat":(?P<json_lat>-?\d+\.\d+),"lng":(?P<json_lng>-?\d+\.\d+)\}'
+)
+
+# og:latitude / og:longitude meta tags, read without parsing the whole page.
+# One scan that skips what Python's HTML parser (BeautifulSoup's
+# html.parser) would not read as a tag: comments, script/style bodies (to
+# their end tag or the end of the page) and other tags are consumed whole.
+# An unclosed comment or tag counts as text up to the next '>', as the
+# parser recovers. Only the attrs group of real <meta> tags is read; quoted
+# attribute values may contain '>'.
+_PAT_META_TAG = re.compile(
+    r'<!--(?:.*?--\s*>|[^>]*>?)'
+    r'|<(?P<raw>script|style)(?=[\s/>])(?:[^>"\']|"[^"]*"|\'[^\']*\')*>.*?(?:</\s*(?P=raw)\s*>|\Z)'
+    r'|<meta\b(?P<attrs>(?:[^>"\']|"[^"]*"|\'[^\']*\')*)>'
+    r'|<[a-z][^\s/>]*(?:[^>"\']|"[^"]*"|\'[^\']*\')*>'
+    r'|<[a-z][^>]*>?',
+    re.IGNORECASE | re.DOTALL
+)
+_PAT_TAG_ATTR = re.compile(r'([^\s=/>"\']+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+)))?')
+
+# Method 3 downloads pages in chunks and stops at the first '@lat,lng' hit;
+# the overlap keeps a hit split across two chunks findable
+HTML_CHUNK_SIZE = 65536
+HTML_CHUNK_OVERLAP = 256
+
+# Method 4 query extraction from query= / /place/ / /search/ URLs
+_M4_QUERY = re.compile(r'[?&]query=([^&]+)')
+_M4_PLACE = re.compile(r'/place/([^/@]+)')
+_M4_SEARCH = re.compile(r'/search/([^/@]+)')
+
 
 def validate_coordinates(lng: float, lat: float) -> Tuple[Optional[float], Optional[float]]:
     """Validate longitude and latitude are within valid ranges."""
@@ -32,45 +139,42 @@ def validate_coordinates(lng: float, lat: float) -> Tuple[Optional[float], Optio
     return lng, lat
 
 
+def validate_coordinates_vectorized(lngs: np.ndarray, lats: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Validate whole longitude/latitude columns at once.
+
+    Same bounds as validate_coordinates; pairs out of range (or missing)
+    come back as NaN in both arrays.
+    """
+    lngs = np.asarray(lngs, dtype=np.float64)
+    lats = np.asarray(lats, dtype=np.float64)
+    mask = (lats >= -90.0) & (lats <= 90.0) & (lngs >= -180.0) & (lngs <= 180.0)
+    return np.where(mask, lngs, np.nan), np.where(mask, lats, np.nan)
+
+
 def method1_regex_extraction(map_link: str) -> Tuple[Optional[float], Optional[float]]:
     """METHOD 1: Direct regex pattern matching (fastest, most reliable)"""
     if not map_link or not isinstance(map_link, str):
         return None, None
 
     try:
-        # Pattern 1: query=lat%2Clng format (URL-encoded comma)
-        pattern_query_encoded = r'[?&]query=(-?\d+\.?\d*)%2C(-?\d+\.?\d*)'
-        match = re.search(pattern_query_encoded, map_link, re.IGNORECASE)
-        if match:
-            lat, lng = float(match.group(1)), float(match.group(2))
-            return validate_coordinates(lng, lat)
-
-        # BUG FIX #9: Make decimal points optional to support integer coordinates
-        # Pattern 2: @lat,lng,zoom format (supports @40,74,12z and @40.123,74.456,12z)
-        pattern2 = r'@(-?\d+(?:\.\d+)?),(-?\d+(?:\.\d+)?),?\d*z?'
-        match = re.search(pattern2, map_link)
-        if match:
-            lat, lng = float(match.group(1)), float(match.group(2))
-            return validate_coordinates(lng, lat)
-
-        # Pattern 3: q=lat,lng format (supports q=40,74 and q=40.123,74.456)
-        pattern3 = r'[?&]q=(-?\d+(?:\.\d+)?),(-?\d+(?:\.\d+)?)'
-        match = re.search(pattern3, map_link)
-        if match:
-            lat, lng = float(match.group(1)), float(match.group(2))
-            return validate_coordinates(lng, lat)
-
-        # Pattern 4: /place/.../@lat,lng (supports integer and decimal)
-        pattern4 = r'/place/[^/]+/@(-?\d+(?:\.\d+)?),(-?\d+(?:\.\d+)?)'
-        match = re.search(pattern4, map_link)
-        if match:
-            lat, lng = float(match.group(1)), float(match.group(2))
+        # Patterns 1-3 in one scan, in priority order:
+        # 1. query=lat%2Clng format (URL-encoded comma)
+        # 2. @lat,lng,zoom format (BUG FIX #9: integer coordinates such as @40,74,12z)
+        # 3. q=lat,lng format (supports q=40,74 and q=40.123,74.456)
+        # The old Pattern 4 (/place/.../@lat,lng) can never be reached: any
+        # URL it matches is already matched by Pattern 2.
+        found = match_priority_pattern(map_link, _PAT_COMBINED, _COMBINED_PRIORITY)
+        if found:
+            _, lat, lng = found
             return validate_coordinates(lng, lat)
 
-        # Pattern 5: Direct coordinate pair (supports integer and decimal)
-        decoded_link = unquote(map_link)
-        pattern5 = r'(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)'
-        match = re.search(pattern5, decoded_link)
+        # Pattern 5: Direct coordinate pair (supports integer and decimal).
+        # Links without '%' have nothing to decode, and a pair needs a comma.
+        decoded_link = unquote(map_link) if '%' in map_link else map_link
+        if ',' not in decoded_link:
+            return None, None
+        match = _PAT_PAIR.search(decoded_link)
         if match:
             coord1, coord2 = float(match.group(1)), float(match.group(2))
             if abs(coord1) <= 90 and abs(coord2) <= 180:
@@ -89,8 +193,10 @@ def method2_url_resolution(map_link: str, timeout=10) -> Tuple[Optional[float],
     """METHOD 2: Resolve shortened URLs and extract from redirect"""
     try:
         if any(domain in map_link for domain in ['goo.gl', 'maps.app.goo.gl', 'google.co.za', 'google.com.au']):
-            response = requests.head(map_link, allow_redirects=True, timeout=timeout)
-            resolved_url = response.url
+            resolved_url = _resolved_urls.get(map_link)
+            if resolved_url is None:
+                response = _session.head(map_link, allow_redirects=True, timeout=timeout)
+                resolved_url = _resolved_urls[map_link] = response.url
 
             if resolved_url != map_link:
                 return method1_regex_extraction(resolved_url)
@@ -102,36 +208,77 @@ def method2_url_resolution(map_link: str, timeout=10) -> Tuple[Optional[float],
         return None, None
 
 
+def _og_meta_contents(html_content: str) -> Dict[str, Optional[str]]:
+    """
+    Return the content of the first og:latitude and og:longitude meta tags.
+
+    Attribute names are matched case-insensitively and values are
+    entity-decoded, as an HTML parser would. A tag without a content
+    attribute maps to None.
+    """
+    found = {}
+    if 'og:l' not in html_content:
+        return found
+
+    for tag in _PAT_META_TAG.finditer(html_content):
+        if tag.group('attrs') is None:
+            continue
+        attrs = {}
+        for attr in _PAT_TAG_ATTR.finditer(tag.group('attrs')):
+            value = next((v for v in attr.group(2, 3, 4) if v is not None), '')
+            attrs[attr.group(1).lower()] = html.unescape(value)
+        prop = attrs.get('property')
+        if prop in ('og:latitude', 'og:longitude') and prop not in found:
+            found[prop] = attrs.get('content')
+            if len(found) == 2:
+                break
+    return found
+
+
 def method3_html_scraping(map_link: str, timeout=15) -> Tuple[Optional[float], Optional[float]]:
     """METHOD 3: Fetch HTML content and scrape coordinates"""
     try:
         headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        response = requests.get(map_link, headers=headers, timeout=timeout, allow_redirects=True)
-
-        if response.status_code == 200:
-            html_content = response.text
-
-            # Try coordinates in HTML
-            coords_in_html = re.search(r'@(-?\d+\.\d+),(-?\d+\.\d+)', html_content)
-            if coords_in_html:
-                lat, lng = float(coords_in_html.group(1)), float(coords_in_html.group(2))
-                return validate_coordinates(lng, lat)
+        with _session.get(map_link, headers=headers, timeout=timeout, allow_redirects=True, stream=True) as response:
+            if response.status_code != 200:
+                return None, None
 
-            # Try JSON data
-            json_pattern = r'"center":\{"lat":(-?\d+\.\d+),"lng":(-?\d+\.\d+)\}'
-            json_match = re.search(json_pattern, html_content)
-            if json_match:
-                lat, lng = float(json_match.group(1)), float(json_match.group(2))
+            # Coordinates in HTML (@lat,lng) take priority over JSON center
+            # data. The page is scanned while it downloads: the first complete
+            # @ hit ends the download, and the first JSON hit is kept in case
+            # the page has no @ hit at all.
+            chunks = []
+            window = b''
+            json_coords = None
+            for chunk in response.iter_content(chunk_size=HTML_CHUNK_SIZE):
+                chunks.append(chunk)
+                window = window[-HTML_CHUNK_OVERLAP:] + chunk
+                for match in _PAT_HTML_COORDS.finditer(window):
+                    if match.group('at_lat') is None:
+                        if json_coords is None:
+                            json_coords = float(match.group('json_lat')), float(match.group('json_lng'))
+                    # An @ hit touching the end of the window may continue in the next chunk
+                    elif match.end() < len(window):
+                        lat, lng = float(match.group('at_lat')), float(match.group('at_lng'))
+                        return validate_coordinates(lng, lat)
+
+            # The download is complete, so an @ hit at the very end is final
+            for match in _PAT_HTML_COORDS.finditer(window):
+                if match.group('at_lat') is not None:
+                    lat, lng = float(match.group('at_lat')), float(match.group('at_lng'))
+                    return validate_coordinates(lng, lat)
+
+            if json_coords is not None:
+                lat, lng = json_coords
                 return validate_coordinates(lng, lat)
 
-            # Try meta tags
-            soup = BeautifulSoup(html_content, 'html.parser')
-            lat_meta = soup.find('meta', property='og:latitude')
-            lng_meta = soup.find('meta', property='og:longitude')
+            html_content = decode_page(b''.join(chunks), response.encoding)
 
-            if lat_meta and lng_meta:
-                lat = float(lat_meta.get('content'))
-                lng = float(lng_meta.get('content'))
+            # Try meta tags (only read when neither pattern matched)
+            og_values = _og_meta_contents(html_content)
+            if 'og:latitude' in og_values and 'og:longitude' in og_values:
+                lat = float(og_values['og:latitude'])
+                lng = float(og_values['og:longitude'])
                 return validate_coordinates(lng, lat)
 
         return None, None
@@ -141,6 +288,24 @@ def method3_html_scraping(map_link: str, timeout=15) -> Tuple[Optional[float], O
         return None, None
 
 
+def _is_number(text: str) -> bool:
+    """True for an optionally negative decimal such as 12, -12. or 12.5"""
+    head, _, tail = (text[1:] if text.startswith('-') else text).partition('.')
+    return head.isdecimal() and (not tail or tail.isdecimal())
+
+
+def is_coordinate_query(query: str) -> bool:
+    """
+    True when a Places query is just a "lat,lng" pair, which Method 1
+    already handles. Plain string checks, no regex.
+    """
+    # A regex '$' also matched before one trailing newline; keep that behaviour
+    if query.endswith('\n'):
+        query = query[:-1]
+    first, comma, second = query.partition(',')
+    return bool(comma) and _is_number(first) and _is_number(second)
+
+
 def method4_google_places_api(map_link: str, api_key: Optional[str] = None) -> Tuple[Optional[float], Optional[float]]:
     """METHOD 4: Use Google Places API Text Search"""
     try:
@@ -154,250 +319,371 @@ def method4_google_places_api(map_link: str, api_key: Optional[str] = None) -> T
         # Extract query from URL
         query = None
 
-        query_match = re.search(r'[?&]query=([^&]+)', map_link)
+        query_match = _M4_QUERY.search(map_link)
         if query_match:
             query = unquote(query_match.group(1)).replace('+', ' ')
-            if re.match(r'^-?\d+\.?\d*,-?\d+\.?\d*$', query):
+            if is_coordinate_query(query):
                 return None, None
 
         if not query:
-            place_match = re.search(r'/place/([^/@]+)', map_link)
+            place_match = _M4_PLACE.search(map_link)
             if place_match:
                 query = unquote(place_match.group(1)).replace('+', ' ')
 
         if not query:
-            search_match = re.search(r'/search/([^/@]+)', map_link)
+            search_match = _M4_SEARCH.search(map_link)
             if search_match:
                 query = unquote(search_match.group(1)).replace('+', ' ')
 
         if not query:
             return None, None
 
+        # Also keyed by API key: an answer given to one key is not reused for another
+        cache_key = (query, api_key)
+        if cache_key in _places_results:
+            return _places_results[cache_key]
+
         # Use Google Places API Text Search
         places_url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
         params = {'query': query, 'key': api_key}
 
-        response = requests.get(places_url, params=params, timeout=10)
+        response = _session.get(places_url, params=params, timeout=10)
         data = response.json()
+        status = data.get('status')
 
-        if data.get('status') == 'OK' and data.get('results'):
+        if status == 'OK' and data.get('results'):
             result = data['results'][0]
             location = result['geometry']['location']
             lat = location['lat']
             lng = location['lng']
-            return validate_coordinates(lng, lat)
+            coordinates = validate_coordinates(lng, lat)
+        elif status in ('OK', 'ZERO_RESULTS'):
+            coordinates = (None, None)
+        else:
+            # Quota, key or server errors may clear up: don't remember them
+            return None, None
 
-        return None, None
+        _places_results[cache_key] = coordinates
+        return coordinates
 
     except Exception as e:
         logger.debug(f"Method 4 failed: {str(e)}")
         return None, None
 
 
-def method5_selenium_scraping(map_link: str, timeout=20) -> Tuple[Optional[float], Optional[float]]:
-    """METHOD 5: Use Selenium to scrape Google Maps (like Puppeteer)"""
-    try:
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.chrome.service import Service
-        from selenium.common.exceptions import TimeoutException as SeleniumTimeoutException
-        from webdriver_manager.chrome import ChromeDriverManager
+def _get_driver():
+    """Return the shared headless Chrome driver, starting it on first use.
 
+    Must be called with _driver_lock held.
+    """
+    global _driver
+    if _driver is None:
         chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+        for argument in CHROME_ARGUMENTS:
+            chrome_options.add_argument(argument)
 
-        # Auto-install ChromeDriver
+        # Auto-install ChromeDriver (once per process)
         service = Service(ChromeDriverManager().install())
         driver = webdriver.Chrome(service=service, options=chrome_options)
 
         # BUG FIX #2: Add page load timeout to prevent infinite hangs
         driver.set_page_load_timeout(15)  # 15 second max page load
         driver.set_script_timeout(10)     # 10 second max script execution
+        _driver = driver
+    return _driver
 
+
+def _quit_driver() -> None:
+    """Shut down the shared Chrome driver, if one was started."""
+    global _driver
+    if _driver is not None:
         try:
-            driver.get(map_link)
-            time.sleep(5)  # Wait for redirect and page load
+            _driver.quit()
+        except Exception as e:
+            logger.debug(f"Chrome driver quit failed: {str(e)}")
+        _driver = None
 
-            # Extract from URL after redirect
-            current_url = driver.current_url
-            match = re.search(r'@(-?\d+\.\d+),(-?\d+\.\d+)', current_url)
 
-            if match:
-                lat, lng = float(match.group(1)), float(match.group(2))
-                result = validate_coordinates(lng, lat)
-                return result
+# BUG FIX #6: the browser is always shut down, now once at interpreter exit
+atexit.register(_quit_driver)
 
-            # Try to extract from page source
-            page_source = driver.page_source
-            match = re.search(r'@(-?\d+\.\d+),(-?\d+\.\d+)', page_source)
 
-            if match:
-                lat, lng = float(match.group(1)), float(match.group(2))
-                result = validate_coordinates(lng, lat)
-                return result
+def method5_selenium_scraping(map_link: str, timeout=20) -> Tuple[Optional[float], Optional[float]]:
+    """
+    METHOD 5: Use Selenium to scrape Google Maps (like Puppeteer)
 
-            return None, None
+    The timeout budget starts once this call has the shared browser, so
+    time spent queued behind other links does not count against it.
+    """
+    if webdriver is None:
+        logger.debug("Method 5 failed: selenium is not installed")
+        return None, None
 
-        except SeleniumTimeoutException:
-            # BUG FIX #2: Handle page load timeout gracefully
-            logger.debug(f"Selenium page load timeout for {map_link}")
-            return None, None
-        finally:
-            # BUG FIX #6: Ensure driver.quit() always runs (no early returns above)
-            driver.quit()
+    try:
+        # One browser for the whole process; page loads on it are serialized
+        with _driver_lock:
+            deadline = time.monotonic() + timeout
+            driver = _get_driver()
+
+            try:
+                driver.get(map_link)
+
+                # Extract from URL after redirect: wait (up to 8s, within the
+                # budget) until the redirected URL carries @lat,lng instead of
+                # sleeping a fixed 5s
+                wait = max(0.0, min(8.0, deadline - time.monotonic()))
+                try:
+                    match = WebDriverWait(driver, wait).until(lambda d: _PAT_HTML_AT.search(d.current_url))
+                except SeleniumTimeoutException:
+                    match = None
+
+                if match:
+                    lat, lng = float(match.group(1)), float(match.group(2))
+                    result = validate_coordinates(lng, lat)
+                    return result
+
+                # Try to extract from page source
+                page_source = driver.page_source
+                match = _PAT_HTML_AT.search(page_source)
+
+                if match:
+                    lat, lng = float(match.group(1)), float(match.group(2))
+                    result = validate_coordinates(lng, lat)
+                    return result
+
+                return None, None
+
+            except SeleniumTimeoutException:
+                # BUG FIX #2: Handle page load timeout gracefully
+                logger.debug(f"Selenium page load timeout for {map_link}")
+                return None, None
+            except Exception:
+                # The browser may have crashed: start a fresh one next time
+                _quit_driver()
+                raise
 
     except Exception as e:
         logger.debug(f"Method 5 failed: {str(e)}")
         return None, None
 
 
-def extract_coordinates_parallel(map_link: str) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+def _all_failed(results: List[Tuple[Optional[float], Optional[float]]]) -> bool:
+    """True when no method produced a coordinate pair."""
+    return all(lng is None or lat is None for lng, lat in results)
+
+
+def _extract_method_results(map_link: str, run_method5: bool = True) -> List[Tuple[Optional[float], Optional[float]]]:
     """
-    Run ALL 5 extraction methods in parallel and return results from each.
+    Run extraction Methods 1-4 and return results from each. Method 1 runs
+    inline; the network-bound Methods 2-4 run in parallel.
+
+    Method 5 (Selenium) drives one shared browser, so it only runs when
+    Methods 1-4 all failed; otherwise its result stays (None, None). With
+    run_method5=False it is left to the caller (see process_excel_file).
 
     Returns:
-        Dict with keys: 'method1', 'method2', 'method3', 'method4', 'method5'
-        Each value is a tuple of (longitude, latitude) or (None, None)
+        List of 5 (longitude, latitude) tuples, Method 1 at index 0; a
+        failed method is (None, None)
     """
-    results = {
-        'method1': (None, None),
-        'method2': (None, None),
-        'method3': (None, None),
-        'method4': (None, None),
-        'method5': (None, None),
-    }
+    results = [(None, None)] * 5
 
     if not map_link or not isinstance(map_link, str):
         return results
 
-    # Define methods to run
-    methods = {
-        'method1': lambda: method1_regex_extraction(map_link),
-        'method2': lambda: method2_url_resolution(map_link),
-        'method3': lambda: method3_html_scraping(map_link),
-        'method4': lambda: method4_google_places_api(map_link),
-        'method5': lambda: method5_selenium_scraping(map_link),
-    }
+    # Method 1 is pure string work: run it inline, not on a worker thread
+    results[0] = method1_regex_extraction(map_link)
 
-    # Run all methods in parallel with timeout protection
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        future_to_method = {executor.submit(func): name for name, func in methods.items()}
+    # Network methods to run, with their index in results
+    methods = (
+        (1, method2_url_resolution),
+        (2, method3_html_scraping),
+        (3, method4_google_places_api),
+    )
+
+    # Run Methods 2-4 in parallel with timeout protection
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        future_to_method = {executor.submit(func, map_link): i for i, func in methods}
 
         try:
             # BUG FIX #1: Add timeout to as_completed (20s max wait for all methods)
             for future in as_completed(future_to_method, timeout=20):
-                method_name = future_to_method[future]
+                i = future_to_method[future]
                 try:
                     # BUG FIX #1: Add timeout to future.result (5s per method)
-                    results[method_name] = future.result(timeout=5)
+                    results[i] = future.result(timeout=5)
                 except TimeoutError:
-                    logger.debug(f"{method_name} timed out after 5 seconds")
-                    results[method_name] = (None, None)
+                    logger.debug(f"method{i + 1} timed out after 5 seconds")
                 except Exception as e:
-                    logger.debug(f"{method_name} raised exception: {str(e)}")
-                    results[method_name] = (None, None)
+                    logger.debug(f"method{i + 1} raised exception: {str(e)}")
         except TimeoutError:
-            # as_completed() timed out - some methods still running
+            # as_completed() timed out - some methods still running; their
+            # slots keep (None, None)
             logger.warning("Parallel extraction timed out after 20 seconds")
-            for future, name in future_to_method.items():
+            for future, i in future_to_method.items():
                 if not future.done():
-                    logger.debug(f"{name} did not complete in time")
-                    if name not in results or results[name] == (None, None):
-                        results[name] = (None, None)
+                    logger.debug(f"method{i + 1} did not complete in time")
+
+    # Method 5 as the last resort. It waits its turn for the shared browser
+    # and enforces its own 20s budget from there, so it runs on this thread
+    # rather than behind a future timeout that would count the wait.
+    if run_method5 and _all_failed(results):
+        results[4] = method5_selenium_scraping(map_link)
 
     return results
 
 
+def extract_coordinates_parallel(map_link: str) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+    """
+    Run all extraction methods on one link (see _extract_method_results).
+
+    Returns:
+        Dict with keys: 'method1', 'method2', 'method3', 'method4', 'method5'
+        Each value is a tuple of (longitude, latitude) or (None, None)
+    """
+    return dict(zip(METHOD_NAMES, _extract_method_results(map_link)))
+
+
+def write_excel_streaming(df: pd.DataFrame, output_file: str) -> None:
+    """
+    Write df to an .xlsx file with a write-only openpyxl workbook.
+
+    Rows are streamed to disk instead of being built up as a full in-memory
+    cell model first. The output matches df.to_excel(index=False): same
+    sheet name and header style, blank cells for missing values, and
+    inf written as text.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Sheet1')
+
+    thin = Side(style='thin')
+    header = []
+    for name in df.columns:
+        cell = WriteOnlyCell(sheet, value=name)
+        cell.font = Font(bold=True)
+        cell.border = Border(top=thin, right=thin, bottom=thin, left=thin)
+        cell.alignment = Alignment(horizontal='center', vertical='top')
+        header.append(cell)
+    sheet.append(header)
+
+    for row in df.itertuples(index=False, name=None):
+        values = []
+        for value in row:
+            if pd.isna(value):
+                value = None
+            elif isinstance(value, float) and value in (float('inf'), float('-inf')):
+                value = 'inf' if value > 0 else '-inf'
+            values.append(value)
+        sheet.append(values)
+
+    workbook.save(output_file)
+
+
 def process_excel_file(input_file: str, output_file: str) -> None:
     """Process Excel file with parallel extraction from all 5 methods."""
     try:
         logger.info(f"Reading input file: {input_file}")
         df = pd.read_excel(input_file)
-        df.columns = df.columns.str.strip()
 
-        column_mapping = {col.lower(): col for col in df.columns}
+        # Strip column names, relabelling the frame only if any name changes
+        columns = list(df.columns)
+        stripped = [col.strip() for col in columns]
+        if stripped != columns:
+            df.columns = stripped
+
+        column_mapping = {col.lower(): col for col in stripped}
 
         # Find map column
-        map_column = None
-        map_column_options = ['map link', 'maps link', 'maps', 'map', 'map links', 'maps links']
-        for option in map_column_options:
-            if option in column_mapping:
-                map_column = column_mapping[option]
-                break
+        map_column = next((column_mapping[a] for a in MAP_COLUMN_ALIASES if a in column_mapping), None)
 
         if not map_column:
             raise ValueError(f'Missing required map column. Found columns: {", ".join(df.columns)}')
 
-        # Add columns for each method
-        for i in range(1, 6):
-            df[f'Method{i}_LONG'] = None
-            df[f'Method{i}_LAT'] = None
-
-        df['Best_LONG'] = None
-        df['Best_LAT'] = None
-        df['Comments'] = None
-
         total_rows = len(df)
         logger.info(f"{'='*60}")
         logger.info(f"🚀 Starting parallel processing: {total_rows} rows")
         logger.info(f"{'='*60}")
 
-        for idx, row in df.iterrows():
-            map_link = row[map_column]
-            row_name = row.get('Name', f"Row {idx + 1}")
-            progress = ((idx + 1) / total_rows) * 100
-
-            logger.info(f"📍 Processing row {idx + 1}/{total_rows} ({progress:.1f}%) - {row_name}")
-
+        # Results are gathered per column in plain lists and assigned to the
+        # DataFrame once all rows are done
+        map_links = df[map_column].tolist()
+        row_names = df['Name'].tolist() if 'Name' in df.columns else None
+        method_lngs = [[None] * total_rows for _ in range(5)]
+        method_lats = [[None] * total_rows for _ in range(5)]
+        best_lngs = [None] * total_rows
+        best_lats = [None] * total_rows
+        comments = [None] * total_rows
+
+        pending = []
+        for idx, map_link in enumerate(map_links):
             if pd.isna(map_link) or str(map_link).strip() == '':
-                df.at[idx, 'Comments'] = 'Skipped: No map link provided'
-                logger.warning(f"   ⏭️  Skipped: No map link provided")
+                row_name = row_names[idx] if row_names is not None else f"Row {idx + 1}"
+                comments[idx] = 'Skipped: No map link provided'
+                logger.warning(f"   ⏭️  Skipped row {idx + 1}/{total_rows} - {row_name}: No map link provided")
                 continue
-
-            # Extract with all 5 methods in parallel
-            logger.info(f"   🔄 Running all 5 methods in parallel...")
-            results = extract_coordinates_parallel(str(map_link))
-
-            # Store results for each method
-            success_count = 0
-            for i in range(1, 6):
-                method_key = f'method{i}'
-                lng, lat = results[method_key]
-
-                if lng is not None and lat is not None:
-                    df.at[idx, f'Method{i}_LONG'] = lng
-                    df.at[idx, f'Method{i}_LAT'] = lat
-                    success_count += 1
-                    logger.info(f"   ✅ Method {i}: Lng={lng:.6f}, Lat={lat:.6f}")
+            pending.append(idx)
+
+        # Extract rows concurrently (methods 1-4 per row); results come back
+        # in row order. Method 5 shares one browser, so rows where 1-4 all
+        # failed run it here one at a time while the pool carries on, instead
+        # of tying up pool workers queued on the browser lock.
+        logger.info(f"   🔄 Extracting {len(pending)} rows ({ROW_WORKERS} at a time)...")
+        links = [str(map_links[idx]) for idx in pending]
+        with ThreadPoolExecutor(max_workers=ROW_WORKERS) as row_executor:
+            row_results = row_executor.map(_extract_method_results, links, [False] * len(links))
+
+            log_rows = logger.isEnabledFor(logging.INFO)
+            log_methods = logger.isEnabledFor(logging.DEBUG)
+
+            for idx, link, results in zip(pending, links, row_results):
+                if _all_failed(results):
+                    results[4] = method5_selenium_scraping(link)
+
+                # Store results for each method; "best" is the first method
+                # that succeeded (Method 1 is the most reliable)
+                success_count = 0
+                best_lng = best_lat = None
+                for i, (lng, lat) in enumerate(results):
+                    if lng is not None and lat is not None:
+                        method_lngs[i][idx] = lng
+                        method_lats[i][idx] = lat
+                        success_count += 1
+                        if best_lng is None:
+                            best_lng, best_lat = lng, lat
+                        if log_methods:
+                            logger.debug("   ✅ Method %d: Lng=%.6f, Lat=%.6f", i + 1, lng, lat)
+                    elif log_methods:
+                        logger.debug("   ❌ Method %d: Failed", i + 1)
+
+                if best_lng is not None:
+                    best_lngs[idx] = best_lng
+                    best_lats[idx] = best_lat
+                    comments[idx] = f'Success: {success_count}/5 methods succeeded'
                 else:
-                    logger.info(f"   ❌ Method {i}: Failed")
+                    comments[idx] = 'Failed: All 5 methods failed'
 
-            # Use Method 1 as "best" (most reliable for coordinates)
-            best_lng, best_lat = results['method1']
+                # One summary line per row; per-method results are at DEBUG
+                if log_rows:
+                    row_name = row_names[idx] if row_names is not None else f"Row {idx + 1}"
+                    progress = ((idx + 1) / total_rows) * 100
+                    logger.info("📍 Row %d/%d (%.1f%%) - %s: %s", idx + 1, total_rows, progress, row_name, comments[idx])
 
-            # If Method 1 failed, try others in order
-            if best_lng is None:
-                for i in range(2, 6):
-                    best_lng, best_lat = results[f'method{i}']
-                    if best_lng is not None:
-                        break
-
-            if best_lng is not None and best_lat is not None:
-                df.at[idx, 'Best_LONG'] = best_lng
-                df.at[idx, 'Best_LAT'] = best_lat
-                df.at[idx, 'Comments'] = f'Success: {success_count}/5 methods succeeded'
-            else:
-                df.at[idx, 'Comments'] = 'Failed: All 5 methods failed'
-
-            logger.info("")
+        # Bounds-check each coordinate column in one NumPy pass
+        for i in range(1, 6):
+            lngs, lats = validate_coordinates_vectorized(
+                np.array(method_lngs[i - 1], dtype=np.float64),
+                np.array(method_lats[i - 1], dtype=np.float64))
+            df[f'Method{i}_LONG'] = lngs
+            df[f'Method{i}_LAT'] = lats
+        lngs, lats = validate_coordinates_vectorized(
+            np.array(best_lngs, dtype=np.float64),
+            np.array(best_lats, dtype=np.float64))
+        df['Best_LONG'] = lngs
+        df['Best_LAT'] = lats
+        df['Comments'] = comments
 
         # Save output
         logger.info(f"Saving output file: {output_file}")
-        df.to_excel(output_file, index=False)
+        write_excel_streaming(df, output_file)
 
         logger.info(f"{'='*60}")
         logger.info(f"✅ Processing complete!")
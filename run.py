@@ -6,11 +6,83 @@ Works on macOS, Windows, and Linux.
 """
 
 import sys
-import subprocess
+
+# Fail fast on an unsupported interpreter, before any other imports
+if sys.version_info < (3, 11):
+    sys.stderr.write(
+        "Error: Python 3.11+ required. You have %d.%d.%d\n"
+        "   Please install Python 3.11 or higher from https://www.python.org/downloads/\n"
+        % sys.version_info[:3]
+    )
+    sys.exit(1)
+
 import os
-import time
+import functools
+import hashlib
 from pathlib import Path
-import shutil
+
+# Set MAP_LINK_NO_PROMPT=1 to accept the setup prompts automatically
+NO_PROMPT = os.environ.get('MAP_LINK_NO_PROMPT') == '1'
+
+# Valid answers to the app menu in select_app()
+MENU_CHOICES = frozenset('1234')
+
+# Interpreter facts, looked up once at import
+PY_EXE = sys.executable
+IS_WINDOWS = sys.platform == 'win32'
+
+# Passed as close_fds to every child process. Python's own descriptors are
+# already non-inheritable (PEP 446), so closing the rest buys nothing here,
+# while leaving it off lets CPython start children with posix_spawn()
+# instead of fork()+exec().
+CLOSE_FDS = False
+# Read size when relaying installer output (see run_streamed)
+STREAM_CHUNK_SIZE = 1 << 16
+
+# Project paths, resolved once at import
+BASE_DIR = Path(__file__).resolve().parent
+VENV_DIR = BASE_DIR / 'venv'
+# uninstall moves the venv to <prefix><pid> before deleting it
+VENV_TRASH_PREFIX = '.venv.trash.'
+REQUIREMENTS_FILE = BASE_DIR / 'requirements.txt'
+FLASK_APP = BASE_DIR / 'flask_app.py'
+CLI_TOOL = BASE_DIR / 'map_converter.py'
+TEST_INPUT = BASE_DIR / 'test_input.xlsx'
+# String forms for the os.path checks
+BASE_DIR_STR = str(BASE_DIR)
+VENV_DIR_STR = str(VENV_DIR)
+REQUIREMENTS_FILE_STR = str(REQUIREMENTS_FILE)
+TEST_INPUT_STR = str(TEST_INPUT)
+# Interpreter location inside a venv on this platform
+VENV_BIN_DIR = 'Scripts' if IS_WINDOWS else 'bin'
+VENV_PYTHON_EXE = 'python.exe' if IS_WINDOWS else 'python'
+VENV_UV_EXE = 'uv.exe' if IS_WINDOWS else 'uv'
+# Written into the venv after a successful install (see install_packages)
+REQUIREMENTS_STAMP = '.req-stamp'
+REQUIREMENTS_STAMP_STR = os.path.join(VENV_DIR_STR, REQUIREMENTS_STAMP)
+# Created by the launcher if missing; the apps write into them
+DATA_DIRS = ('uploads', 'processed')
+# Run by the venv's Python in a venv that has no stamp: exits non-zero unless
+# every package in requirements.txt (argv[1]) is installed at its pinned version
+REQUIREMENTS_CHECK = """
+import re, sys
+from importlib.metadata import PackageNotFoundError, version
+for line in open(sys.argv[1], encoding='utf-8'):
+    requirement = line.split('#', 1)[0].split(';', 1)[0].strip()
+    name = re.match(r'[A-Za-z0-9._-]*', requirement).group()
+    if not name:
+        continue
+    try:
+        installed = version(name)
+    except PackageNotFoundError:
+        sys.exit(1)
+    pinned = requirement.partition('==')[2].strip()
+    if pinned and installed != pinned:
+        sys.exit(1)
+"""
+
+# Color only a terminal, and honour NO_COLOR (https://no-color.org)
+USE_COLOR = sys.stdout.isatty() and not os.environ.get('NO_COLOR')
 
 # ANSI color codes for terminal output (works on most terminals)
 class Colors:
@@ -21,42 +93,52 @@ class Colors:
     END = '\033[0m'
     BOLD = '\033[1m'
 
-def print_colored(message, color=''):
-    """Print colored message (works cross-platform)"""
-    print(f"{color}{message}{Colors.END}")
+# Redirected output gets no escape sequences at all
+if not USE_COLOR:
+    for _name in ('BLUE', 'GREEN', 'YELLOW', 'RED', 'END', 'BOLD'):
+        setattr(Colors, _name, '')
+
+# Fixed banner lines, colored once at import
+HEADER = (
+    f"{Colors.BLUE}\n{'=' * 60}{Colors.END}\n"
+    f"{Colors.BOLD}{Colors.BLUE}  🗺️  Excel Map Coordinates Converter{Colors.END}\n"
+    f"{Colors.BLUE}{'=' * 60}\n{Colors.END}"
+)
+SEPARATOR = f"{Colors.BLUE}\n{'=' * 60}{Colors.END}"
+GOODBYE = f"{Colors.BLUE}\n   👋 Goodbye!{Colors.END}"
+INTERRUPTED_GOODBYE = f"{Colors.BLUE}\n\n   👋 Goodbye!{Colors.END}"
+
+if USE_COLOR:
+    def print_colored(message, color='', _end=Colors.END):
+        """Print colored message (works cross-platform)"""
+        print(f"{color}{message}{_end}")
+else:
+    def print_colored(message, color=''):
+        """Print message as plain text (see USE_COLOR)"""
+        print(message)
 
 def print_header():
     """Print application header"""
-    print_colored("\n" + "="*60, Colors.BLUE)
-    print_colored("  🗺️  Excel Map Coordinates Converter", Colors.BOLD + Colors.BLUE)
-    print_colored("="*60 + "\n", Colors.BLUE)
+    print(HEADER)
 
 def check_python_version():
-    """Check if Python version is 3.11 or higher"""
+    """Report the Python version (3.11+ is enforced at import)"""
     print_colored("🔍 Checking Python version...", Colors.BLUE)
     version = sys.version_info
-
-    if version.major < 3 or (version.major == 3 and version.minor < 11):
-        print_colored(
-            f"❌ Error: Python 3.11+ required. You have {version.major}.{version.minor}.{version.micro}",
-            Colors.RED
-        )
-        print_colored("   Please install Python 3.11 or higher from https://www.python.org/downloads/", Colors.YELLOW)
-        return False
-
     print_colored(f"   ✅ Python {version.major}.{version.minor}.{version.micro}", Colors.GREEN)
     return True
 
 def setup_virtual_environment():
     """Create virtual environment if it doesn't exist"""
+    import subprocess
+
     print_colored("\n🔧 Setting up virtual environment...", Colors.BLUE)
 
     try:
-        base_dir = Path(__file__).parent
-        venv_dir = base_dir / 'venv'
+        venv_dir = VENV_DIR
 
         # Check if venv exists
-        if venv_dir.exists():
+        if os.path.isdir(VENV_DIR_STR):
             print_colored("   ✅ Virtual environment already exists", Colors.GREEN)
             return venv_dir
     except PermissionError as e:
@@ -71,23 +153,50 @@ def setup_virtual_environment():
     # Create virtual environment
     try:
         print_colored("   📦 Creating virtual environment (this may take 10-30 seconds)...", Colors.YELLOW)
-        print_colored("   ⏳ Please wait, running: python -m venv venv\n", Colors.BLUE)
+        print_colored("   ⏳ Please wait, creating venv/\n", Colors.BLUE)
+
+        # uv creates a venv (seeded with pip for the pip fallback) in well
+        # under a second
+        if check_uv_available():
+            try:
+                subprocess.run(
+                    [find_uv(), 'venv', '--seed', '--python', PY_EXE, str(venv_dir)],
+                    check=True,
+                    close_fds=CLOSE_FDS
+                )
+                print_colored("   ✅ Virtual environment created successfully with uv", Colors.GREEN)
+                return venv_dir
+            except subprocess.CalledProcessError as e:
+                print_colored(f"   ⚠️  uv venv failed ({e}), using the venv module instead", Colors.YELLOW)
+
+        # Build it in this interpreter first: no second Python start-up
+        error = create_venv_in_process(venv_dir)
+        if error is None:
+            print()  # New line after dots
+            print_colored("   ✅ Virtual environment created successfully", Colors.GREEN)
+            return venv_dir
+
+        print()  # New line after dots
+        print_colored(f"   ⚠️  In-process setup failed ({error}), retrying with: python -m venv venv", Colors.YELLOW)
 
         # Use Popen to show we're still alive during creation
         process = subprocess.Popen(
-            [sys.executable, '-m', 'venv', str(venv_dir)],
-            stdout=subprocess.PIPE,
+            [PY_EXE, '-m', 'venv', str(venv_dir)],
+            stdout=subprocess.DEVNULL,
             stderr=subprocess.PIPE,
-            text=True
+            text=True,
+            close_fds=CLOSE_FDS
         )
 
-        # Wait and show dots to indicate progress
-        while process.poll() is None:
-            print(".", end="", flush=True)
-            time.sleep(0.5)
-
-        # Capture output for debugging
-        stdout, stderr = process.communicate()
+        # Wait and show dots to indicate progress. communicate() keeps
+        # draining stderr while it waits, so a chatty child can't fill the
+        # pipe and block; the captured stderr is kept for error reporting.
+        while True:
+            try:
+                _, stderr = process.communicate(timeout=0.5)
+                break
+            except subprocess.TimeoutExpired:
+                print(".", end="", flush=True)
 
         if process.returncode != 0:
             print()  # New line after dots
@@ -109,41 +218,156 @@ def setup_virtual_environment():
         print_colored(f"\n   ❌ Error creating virtual environment: {e}", Colors.RED)
         return None
 
+def create_venv_in_process(venv_dir):
+    """Create the venv with the venv module, printing dots until it is done.
+
+    Returns None on success, or the exception that stopped it.
+    """
+    import threading
+    import venv
+
+    errors = []
+
+    def build():
+        try:
+            venv.EnvBuilder(with_pip=True, symlinks=not IS_WINDOWS).create(str(venv_dir))
+        except Exception as e:
+            errors.append(e)
+
+    worker = threading.Thread(target=build, daemon=True)
+    worker.start()
+    while True:
+        worker.join(0.5)
+        if not worker.is_alive():
+            break
+        print(".", end="", flush=True)
+
+    return errors[0] if errors else None
+
 def get_venv_python(venv_dir):
     """Get path to Python executable in virtual environment"""
-    if sys.platform == 'win32':
-        return venv_dir / 'Scripts' / 'python.exe'
-    else:
-        return venv_dir / 'bin' / 'python'
+    return venv_dir / VENV_BIN_DIR / VENV_PYTHON_EXE
 
-def get_venv_pip(venv_dir):
-    """Get path to pip executable in virtual environment"""
-    if sys.platform == 'win32':
-        return venv_dir / 'Scripts' / 'pip.exe'
-    else:
-        return venv_dir / 'bin' / 'pip'
+@functools.lru_cache(maxsize=1)
+def find_uv():
+    """Return the absolute path of uv on PATH, or None (looked up once)"""
+    import shutil
+
+    return shutil.which('uv')
 
 def check_uv_available():
     """Check if uv is available in system"""
+    return find_uv() is not None
+
+def requirements_digest(venv_dir):
+    """Hash requirements.txt together with the venv's Python (pyvenv.cfg)"""
+    digest = hashlib.blake2b(REQUIREMENTS_FILE.read_bytes(), digest_size=16)
     try:
-        subprocess.run(['uv', '--version'], capture_output=True, check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        digest.update((venv_dir / 'pyvenv.cfg').read_bytes())
+    except OSError:
+        pass
+    return digest.hexdigest()
+
+def venv_has_packages(venv_dir):
+    """Check whether the venv has every requirements.txt package at its pinned version"""
+    import subprocess
+
+    try:
+        return subprocess.call(
+            [str(get_venv_python(venv_dir)), '-c', REQUIREMENTS_CHECK, REQUIREMENTS_FILE_STR],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=CLOSE_FDS
+        ) == 0
+    except OSError:
         return False
 
+def run_streamed(command):
+    """Run command, copying its combined output to our stdout in chunks.
+
+    The child writes into a pipe we drain in 64 KiB reads, so it never
+    waits on a slow terminal redrawing its progress output. Raises
+    CalledProcessError on a non-zero exit, like check_call.
+    """
+    import subprocess
+
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=STREAM_CHUNK_SIZE,
+        close_fds=CLOSE_FDS
+    )
+    sys.stdout.flush()  # Keep our own earlier messages ahead of the child's
+    out = sys.stdout.buffer
+    with process.stdout:
+        while True:
+            chunk = process.stdout.read1(STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            out.write(chunk)
+            out.flush()
+    returncode = process.wait()
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, command)
+
+def bootstrap_venv_uv(venv_dir):
+    """Return uv inside the venv, pip-installing it there first if needed.
+
+    One small wheel through pip, after which uv installs the requirements.
+    Returns None if uv can't be installed (e.g. offline).
+    """
+    import subprocess
+
+    uv_path = venv_dir / VENV_BIN_DIR / VENV_UV_EXE
+    if not os.path.isfile(uv_path):
+        print_colored("   📥 uv not found; installing it into the venv with pip...", Colors.YELLOW)
+        try:
+            subprocess.check_call(
+                [str(get_venv_python(venv_dir)), '-m', 'pip', 'install', '--quiet', 'uv'],
+                close_fds=CLOSE_FDS
+            )
+        except (subprocess.CalledProcessError, OSError) as e:
+            print_colored(f"   ⚠️  Could not install uv: {e}", Colors.YELLOW)
+            return None
+        if not os.path.isfile(uv_path):
+            return None
+    return str(uv_path)
+
 def install_packages(venv_dir):
     """Install required packages in virtual environment using uv or pip"""
-    print_colored("\n📦 Installing required packages...", Colors.BLUE)
+    import subprocess
 
-    base_dir = Path(__file__).parent
-    requirements_file = base_dir / 'requirements.txt'
+    print_colored("\n📦 Installing required packages...", Colors.BLUE)
 
-    if not requirements_file.exists():
+    if not os.path.isfile(REQUIREMENTS_FILE_STR):
         print_colored("   ❌ Error: requirements.txt not found!", Colors.RED)
         return False
 
-    # Check if uv is available (much faster than pip)
-    use_uv = check_uv_available()
+    # Skip the installer when this exact requirements.txt was already
+    # installed into this venv (stamp written after the last success)
+    stamp_file = venv_dir / REQUIREMENTS_STAMP
+    digest = requirements_digest(venv_dir)
+    try:
+        if stamp_file.read_text().strip() == digest:
+            print_colored("   ✅ Packages up-to-date (requirements.txt unchanged)", Colors.GREEN)
+            # Refresh the stamp's mtime so the next launch takes the fast path
+            write_requirements_stamp(stamp_file, digest)
+            return True
+    except FileNotFoundError:
+        # No stamp yet (venv set up before stamps existed): if every pinned
+        # package is already installed, record the stamp instead of reinstalling
+        if venv_has_packages(venv_dir):
+            print_colored("   ✅ Packages already installed", Colors.GREEN)
+            write_requirements_stamp(stamp_file, digest)
+            return True
+    except OSError:
+        pass
+
+    # Use uv (much faster than pip): the system one, or one installed into
+    # the venv on an earlier run or just now
+    uv_path = find_uv() or bootstrap_venv_uv(venv_dir)
+    use_uv = uv_path is not None
 
     if use_uv:
         print_colored("   ⚡ Using uv (fast package installer)", Colors.GREEN)
@@ -151,11 +375,11 @@ def install_packages(venv_dir):
 
         try:
             # Use uv pip install with verbose output
-            subprocess.check_call(
-                ['uv', 'pip', 'install', '-r', str(requirements_file), '--python', str(get_venv_python(venv_dir))],
-                # NO stdout/stderr suppression - show everything!
+            run_streamed(
+                [uv_path, 'pip', 'install', '-r', str(REQUIREMENTS_FILE), '--python', str(get_venv_python(venv_dir))]
             )
             print_colored("\n   ✅ All packages installed successfully with uv", Colors.GREEN)
+            write_requirements_stamp(stamp_file, digest)
             return True
         except subprocess.CalledProcessError as e:
             print_colored(f"\n   ❌ Error with uv: {e}", Colors.RED)
@@ -164,32 +388,40 @@ def install_packages(venv_dir):
 
     if not use_uv:
         print_colored("   🐍 Using pip (standard installer)", Colors.BLUE)
-        print_colored("   💡 Install uv for faster installs: pip install uv", Colors.YELLOW)
         print_colored("   📥 Installing dependencies with verbose output...\n", Colors.YELLOW)
 
-        pip_path = get_venv_pip(venv_dir)
+        python_path = get_venv_python(venv_dir)
 
         try:
-            # Use pip with VERBOSE output (no -q, no DEVNULL)
+            # Use pip with VERBOSE output (no -q, no DEVNULL); run as
+            # "python -m pip" to skip the pip/pip.exe launcher
             subprocess.check_call(
-                [str(pip_path), 'install', '-r', str(requirements_file)],
+                [str(python_path), '-m', 'pip', 'install', '-r', str(REQUIREMENTS_FILE)],
                 # NO stdout/stderr suppression - show everything!
+                close_fds=CLOSE_FDS
             )
             print_colored("\n   ✅ All packages installed successfully with pip", Colors.GREEN)
+            write_requirements_stamp(stamp_file, digest)
             return True
         except subprocess.CalledProcessError as e:
             print_colored(f"\n   ❌ Error installing packages: {e}", Colors.RED)
             print_colored("   💡 Try manually: pip install -r requirements.txt", Colors.YELLOW)
             return False
 
+def write_requirements_stamp(stamp_file, digest):
+    """Record a successful install; failing to write it only costs a reinstall"""
+    try:
+        stamp_file.write_text(digest)
+    except OSError:
+        pass
+
 def install_packages_system():
     """Install packages to system Python (fallback when venv fails)"""
-    print_colored("\n📦 Installing packages to system Python...", Colors.BLUE)
+    import subprocess
 
-    base_dir = Path(__file__).parent
-    requirements_file = base_dir / 'requirements.txt'
+    print_colored("\n📦 Installing packages to system Python...", Colors.BLUE)
 
-    if not requirements_file.exists():
+    if not os.path.isfile(REQUIREMENTS_FILE_STR):
         print_colored("   ❌ Error: requirements.txt not found!", Colors.RED)
         return False
 
@@ -201,8 +433,8 @@ def install_packages_system():
         print_colored("   📥 Installing dependencies to user directory (no admin needed)...\n", Colors.YELLOW)
 
         try:
-            subprocess.check_call(
-                ['uv', 'pip', 'install', '-r', str(requirements_file), '--user'],
+            run_streamed(
+                [find_uv(), 'pip', 'install', '-r', str(REQUIREMENTS_FILE), '--user']
             )
             print_colored("\n   ✅ All packages installed successfully with uv", Colors.GREEN)
             return True
@@ -218,7 +450,8 @@ def install_packages_system():
         try:
             # Use --user flag to install to user directory (no admin needed!)
             subprocess.check_call(
-                [sys.executable, '-m', 'pip', 'install', '--user', '-r', str(requirements_file)],
+                [PY_EXE, '-m', 'pip', 'install', '--user', '-r', str(REQUIREMENTS_FILE)],
+                close_fds=CLOSE_FDS
             )
             print_colored("\n   ✅ All packages installed successfully with pip", Colors.GREEN)
             return True
@@ -226,28 +459,58 @@ def install_packages_system():
             print_colored(f"\n   ❌ Error installing packages: {e}", Colors.RED)
             return False
 
-def validate_paths():
-    """Validate and create necessary directories"""
+def scan_project_dirs():
+    """Create the data directories and list the project directory.
+
+    Returns (present, created): the project's entries by name, and for
+    each data directory None or the error that stopped its creation.
+    Prints nothing, so it can run while the venv is being set up.
+    """
+    # One directory listing instead of a stat() per checked path
+    try:
+        with os.scandir(BASE_DIR_STR) as entries:
+            present = {entry.name: entry for entry in entries}
+    except OSError:
+        present = {}
+
+    # Only directories the listing didn't show need a mkdir
+    created = {}
+    for dir_name in DATA_DIRS:
+        if dir_name in present and present[dir_name].is_dir():
+            created[dir_name] = None
+            continue
+        try:
+            os.makedirs(os.path.join(BASE_DIR_STR, dir_name), exist_ok=True)
+            created[dir_name] = None
+        except Exception as e:
+            created[dir_name] = e
+
+    return present, created
+
+def validate_paths(scan=None):
+    """Validate and create necessary directories
+
+    scan is a scan_project_dirs() result taken earlier, if any.
+    """
     print_colored("\n📁 Validating directory structure...", Colors.BLUE)
 
-    base_dir = Path(__file__).parent
     required_dirs = ['uploads', 'processed', 'static', 'templates', 'tests']
 
     all_valid = True
 
-    for dir_name in required_dirs:
-        dir_path = base_dir / dir_name
+    present, created = scan if scan is not None else scan_project_dirs()
 
-        if dir_name in ['uploads', 'processed']:
-            # Create if doesn't exist (with error handling for Windows)
-            try:
-                dir_path.mkdir(parents=True, exist_ok=True)
+    for dir_name in required_dirs:
+        if dir_name in created:
+            # Created if it didn't exist (with error handling for Windows)
+            error = created[dir_name]
+            if error is None:
                 print_colored(f"   ✅ {dir_name}/ - Created/Verified", Colors.GREEN)
-            except PermissionError:
+            elif isinstance(error, PermissionError):
                 print_colored(f"   ⚠️  {dir_name}/ - Permission denied (will create at runtime)", Colors.YELLOW)
-            except Exception as e:
-                print_colored(f"   ⚠️  {dir_name}/ - Could not create: {e}", Colors.YELLOW)
-        elif dir_path.exists():
+            else:
+                print_colored(f"   ⚠️  {dir_name}/ - Could not create: {error}", Colors.YELLOW)
+        elif dir_name in present and present[dir_name].is_dir():
             print_colored(f"   ✅ {dir_name}/ - Found", Colors.GREEN)
         else:
             print_colored(f"   ⚠️  {dir_name}/ - Not found (optional)", Colors.YELLOW)
@@ -260,8 +523,7 @@ def validate_paths():
     }
 
     for file_name, description in required_files.items():
-        file_path = base_dir / file_name
-        if file_path.exists():
+        if file_name in present and present[file_name].is_file():
             print_colored(f"   ✅ {file_name} - {description}", Colors.GREEN)
         else:
             print_colored(f"   ❌ {file_name} - Missing!", Colors.RED)
@@ -269,6 +531,28 @@ def validate_paths():
 
     return all_valid
 
+def setup_is_current():
+    """True when the venv's install stamp is newer than requirements.txt"""
+    try:
+        return os.stat(REQUIREMENTS_STAMP_STR).st_mtime >= os.stat(REQUIREMENTS_FILE_STR).st_mtime
+    except OSError:
+        return False
+
+def ensure_data_dirs():
+    """Create uploads/ and processed/ without the full path validation"""
+    for dir_name in DATA_DIRS:
+        try:
+            os.makedirs(os.path.join(BASE_DIR_STR, dir_name), exist_ok=True)
+        except OSError:
+            pass  # Created at runtime by the apps
+
+def confirm(prompt):
+    """Ask a y/n question; MAP_LINK_NO_PROMPT=1 answers yes without reading stdin"""
+    if NO_PROMPT:
+        print(f"{prompt}y")
+        return True
+    return input(prompt).strip().lower() == 'y'
+
 def select_app():
     """Ask user which app to run"""
     print_colored("\n🚀 Select application to run:", Colors.BLUE)
@@ -281,66 +565,70 @@ def select_app():
         try:
             choice = input("\n   Enter choice (1-4): ").strip()
 
-            if choice in ['1', '2', '3', '4']:
+            if choice in MENU_CHOICES:
                 return int(choice)
             else:
                 print_colored("   ⚠️  Invalid choice. Please enter 1-4.", Colors.YELLOW)
         except KeyboardInterrupt:
-            print_colored("\n\n   👋 Goodbye!", Colors.BLUE)
+            print(INTERRUPTED_GOODBYE)
             sys.exit(0)
 
 def run_flask_app(venv_dir):
     """Run Flask application using venv or system Python"""
+    import subprocess
+
     print_colored("\n🌐 Starting Flask Web Server...", Colors.GREEN)
     print_colored("   Access the app at: http://localhost:5000", Colors.BOLD + Colors.GREEN)
     print_colored("   Press Ctrl+C to stop\n", Colors.YELLOW)
 
-    base_dir = Path(__file__).parent
-    flask_app = base_dir / 'flask_app.py'
-
     # Use venv Python if available, otherwise system Python
     if venv_dir:
         python_path = get_venv_python(venv_dir)
     else:
-        python_path = sys.executable
+        python_path = PY_EXE
         print_colored("   ℹ️  Using system Python", Colors.BLUE)
 
+    # The server runs until Ctrl+C, so on POSIX the launcher hands its
+    # process over to it instead of waiting on a child. (Windows emulates
+    # execv with a new process, which detaches it from the console.)
+    if not IS_WINDOWS:
+        sys.stdout.flush()
+        os.execv(str(python_path), [str(python_path), str(FLASK_APP)])
+
     try:
-        subprocess.run([str(python_path), str(flask_app)])
+        subprocess.run([str(python_path), str(FLASK_APP)], close_fds=CLOSE_FDS)
     except KeyboardInterrupt:
         print_colored("\n\n   ⏹️  Flask server stopped.", Colors.YELLOW)
 
 def run_cli_tool(venv_dir):
     """Run CLI tool using venv or system Python"""
+    import subprocess
+
     print_colored("\n💻 Command Line Tool", Colors.GREEN)
     print_colored("   Usage: python map_converter.py <input.xlsx> <output.xlsx>\n", Colors.YELLOW)
 
-    base_dir = Path(__file__).parent
-
     # Use venv Python if available, otherwise system Python
     if venv_dir:
         python_path = get_venv_python(venv_dir)
     else:
-        python_path = sys.executable
+        python_path = PY_EXE
         print_colored("   ℹ️  Using system Python", Colors.BLUE)
 
     # Check for test file
-    test_input = base_dir / 'test_input.xlsx'
-    if test_input.exists():
+    if os.path.isfile(TEST_INPUT_STR):
         print_colored("   📝 Test file found: test_input.xlsx", Colors.GREEN)
         run_test = input("   Run test conversion? (y/n): ").strip().lower()
 
         if run_test == 'y':
-            output_file = base_dir / 'test_output_new.xlsx'
-            cli_tool = base_dir / 'map_converter.py'
+            output_file = BASE_DIR / 'test_output_new.xlsx'
 
             try:
                 subprocess.run([
                     str(python_path),
-                    str(cli_tool),
-                    str(test_input),
+                    str(CLI_TOOL),
+                    TEST_INPUT_STR,
                     str(output_file)
-                ])
+                ], close_fds=CLOSE_FDS)
                 print_colored(f"\n   ✅ Output saved to: {output_file}", Colors.GREEN)
             except Exception as e:
                 print_colored(f"\n   ❌ Error: {e}", Colors.RED)
@@ -348,14 +636,72 @@ def run_cli_tool(venv_dir):
         print_colored("   ℹ️  Provide input and output file paths to process.", Colors.BLUE)
         input("   Press Enter to continue...")
 
+def remove_tree(path):
+    """Delete a directory tree as fast as the platform allows, ignoring errors
+
+    POSIX hands it to 'rm -rf'. Elsewhere files are unlinked on a thread
+    pool, then the directories are removed deepest first.
+    """
+    if not IS_WINDOWS:
+        import subprocess
+
+        try:
+            subprocess.run(['rm', '-rf', path], stdin=subprocess.DEVNULL, close_fds=CLOSE_FDS)
+            return
+        except OSError:
+            pass
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    dirs = []
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+        pending = [path]
+        while pending:
+            dir_path = pending.pop()
+            dirs.append(dir_path)
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        else:
+                            pool.submit(os.unlink, entry.path)
+            except OSError:
+                pass
+
+    # A directory is always listed before its subdirectories
+    for dir_path in reversed(dirs):
+        try:
+            os.rmdir(dir_path)
+        except OSError:
+            pass
+
+def remove_leftover_trash():
+    """Delete venvs an earlier uninstall moved aside but didn't finish removing
+
+    That happens when the launcher is stopped before uninstall's background
+    delete completes. Each leftover is removed on its own thread.
+    """
+    import threading
+
+    try:
+        with os.scandir(BASE_DIR_STR) as entries:
+            leftovers = [entry.path for entry in entries
+                         if entry.name.startswith(VENV_TRASH_PREFIX) and entry.is_dir(follow_symlinks=False)]
+    except OSError:
+        return
+
+    for path in leftovers:
+        threading.Thread(target=remove_tree, args=(path,)).start()
+
 def uninstall():
     """Remove virtual environment and clean up"""
-    print_colored("\n🗑️  Uninstalling...", Colors.YELLOW)
+    import shutil
+    import threading
 
-    base_dir = Path(__file__).parent
-    venv_dir = base_dir / 'venv'
+    print_colored("\n🗑️  Uninstalling...", Colors.YELLOW)
 
-    if not venv_dir.exists():
+    if not os.path.isdir(VENV_DIR_STR):
         print_colored("   ℹ️  No virtual environment found. Nothing to uninstall.", Colors.BLUE)
         return
 
@@ -364,7 +710,15 @@ def uninstall():
 
     if confirm in ['yes', 'y']:
         try:
-            shutil.rmtree(venv_dir)
+            # Move the venv aside (one rename) and delete the files in the
+            # background; fall back to deleting in place if it can't be moved
+            trash_dir = VENV_DIR.with_name(f'{VENV_TRASH_PREFIX}{os.getpid()}')
+            try:
+                os.rename(VENV_DIR, trash_dir)
+            except OSError:
+                shutil.rmtree(VENV_DIR)
+            else:
+                threading.Thread(target=remove_tree, args=(str(trash_dir),)).start()
             print_colored("   ✅ Virtual environment removed successfully", Colors.GREEN)
             print_colored("   ℹ️  Run this script again to reinstall", Colors.BLUE)
         except Exception as e:
@@ -372,6 +726,74 @@ def uninstall():
     else:
         print_colored("   ❌ Uninstall cancelled", Colors.YELLOW)
 
+def prepare_environment():
+    """Set up the venv and packages and check the project files (steps 2-4)
+
+    Returns the venv directory, or None to use system Python.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    # The step 4 directory scan and the uv lookup don't depend on the venv:
+    # run them in the background while steps 2-3 do
+    background = ThreadPoolExecutor(max_workers=2)
+    scan_future = background.submit(scan_project_dirs)
+    background.submit(find_uv)
+    background.shutdown(wait=False)
+
+    # Step 2: Setup virtual environment
+    venv_dir = setup_virtual_environment()
+    use_system_python = False
+
+    if not venv_dir:
+        print_colored("\n⚠️  Warning: Could not create virtual environment.", Colors.YELLOW)
+        print_colored("   💡 This can happen on Windows with restricted permissions.", Colors.BLUE)
+        print_colored("   📌 Options:", Colors.BLUE)
+        print_colored("      1. Install packages to system Python (easier)", Colors.YELLOW)
+        print_colored("      2. Exit and run as Administrator", Colors.YELLOW)
+
+        if confirm("\n   Install to system Python? (y/n): "):
+            print_colored("\n   ✅ Will install packages to system Python", Colors.GREEN)
+            use_system_python = True
+            venv_dir = None  # Signal to use system Python
+        else:
+            print_colored("\n   ❌ Exiting. Please run as Administrator and try again.", Colors.RED)
+            sys.exit(1)
+
+    # Problems that don't stop the launcher; the user confirms them
+    # all at once after the last check
+    warnings = []
+
+    # Step 3: Install packages (in venv or system Python)
+    if use_system_python:
+        print_colored("\n📦 Installing packages to system Python...", Colors.BLUE)
+        if not install_packages_system():
+            warnings.append("Some packages failed to install.")
+    elif venv_dir:
+        if not install_packages(venv_dir):
+            print_colored("\n⚠️  Warning: Some packages failed to install.", Colors.YELLOW)
+            print_colored("   💡 Try installing to system Python instead.", Colors.YELLOW)
+            if confirm("   Try system Python? (y/n): "):
+                use_system_python = True
+                venv_dir = None
+                if not install_packages_system():
+                    print_colored("\n❌ Installation failed. Exiting.", Colors.RED)
+                    sys.exit(1)
+            else:
+                warnings.append("Some packages failed to install.")
+
+    # Step 4: Validate paths
+    if not validate_paths(scan_future.result()):
+        warnings.append("Some required files are missing.")
+
+    if warnings:
+        print_colored(f"\n⚠️  Preflight finished with {len(warnings)} warning(s):", Colors.YELLOW)
+        for warning in warnings:
+            print_colored(f"   • {warning}", Colors.YELLOW)
+        if not confirm("   Continue anyway? (y/n): "):
+            sys.exit(1)
+
+    return venv_dir
+
 def main():
     """Main launcher function"""
     try:
@@ -379,59 +801,16 @@ def main():
         print_header()
 
         # Step 1: Check Python version
-        if not check_python_version():
-            sys.exit(1)
-
-        # Step 2: Setup virtual environment
-        venv_dir = setup_virtual_environment()
-        use_system_python = False
-
-        if not venv_dir:
-            print_colored("\n⚠️  Warning: Could not create virtual environment.", Colors.YELLOW)
-            print_colored("   💡 This can happen on Windows with restricted permissions.", Colors.BLUE)
-            print_colored("   📌 Options:", Colors.BLUE)
-            print_colored("      1. Install packages to system Python (easier)", Colors.YELLOW)
-            print_colored("      2. Exit and run as Administrator", Colors.YELLOW)
-
-            choice = input("\n   Install to system Python? (y/n): ").strip().lower()
-            if choice == 'y':
-                print_colored("\n   ✅ Will install packages to system Python", Colors.GREEN)
-                use_system_python = True
-                venv_dir = None  # Signal to use system Python
-            else:
-                print_colored("\n   ❌ Exiting. Please run as Administrator and try again.", Colors.RED)
-                sys.exit(1)
-
-        # Step 3: Install packages (in venv or system Python)
-        if use_system_python:
-            print_colored("\n📦 Installing packages to system Python...", Colors.BLUE)
-            if not install_packages_system():
-                print_colored("\n⚠️  Warning: Some packages failed to install.", Colors.YELLOW)
-                proceed = input("   Continue anyway? (y/n): ").strip().lower()
-                if proceed != 'y':
-                    sys.exit(1)
-        elif venv_dir:
-            if not install_packages(venv_dir):
-                print_colored("\n⚠️  Warning: Some packages failed to install.", Colors.YELLOW)
-                print_colored("   💡 Try installing to system Python instead.", Colors.YELLOW)
-                choice = input("   Try system Python? (y/n): ").strip().lower()
-                if choice == 'y':
-                    use_system_python = True
-                    venv_dir = None
-                    if not install_packages_system():
-                        print_colored("\n❌ Installation failed. Exiting.", Colors.RED)
-                        sys.exit(1)
-                else:
-                    proceed = input("   Continue anyway? (y/n): ").strip().lower()
-                    if proceed != 'y':
-                        sys.exit(1)
-
-        # Step 4: Validate paths
-        if not validate_paths():
-            print_colored("\n⚠️  Warning: Some required files are missing.", Colors.YELLOW)
-            proceed = input("   Continue anyway? (y/n): ").strip().lower()
-            if proceed != 'y':
-                sys.exit(1)
+        check_python_version()
+        remove_leftover_trash()
+
+        # Steps 2-4, unless nothing changed since the last successful setup
+        if setup_is_current():
+            print_colored("\n✅ Setup unchanged since last run (venv and packages up to date)", Colors.GREEN)
+            ensure_data_dirs()
+            venv_dir = VENV_DIR
+        else:
+            venv_dir = prepare_environment()
 
         # Step 5: Select and run app
         while True:
@@ -443,21 +822,21 @@ def main():
                 run_cli_tool(venv_dir)
             elif choice == 3:
                 uninstall()
-                print_colored("\n   👋 Goodbye!", Colors.BLUE)
+                print(GOODBYE)
                 break
             elif choice == 4:
-                print_colored("\n   👋 Goodbye!", Colors.BLUE)
+                print(GOODBYE)
                 break
 
             # Ask if user wants to run another app
-            print_colored("\n" + "="*60, Colors.BLUE)
+            print(SEPARATOR)
             again = input("\n   Run another app? (y/n): ").strip().lower()
             if again != 'y':
-                print_colored("\n   👋 Goodbye!", Colors.BLUE)
+                print(GOODBYE)
                 break
 
     except KeyboardInterrupt:
-        print_colored("\n\n   👋 Goodbye!", Colors.BLUE)
+        print(INTERRUPTED_GOODBYE)
         sys.exit(0)
     except Exception as e:
         print_colored(f"\n   ❌ Unexpected error: {e}", Colors.RED)
@@ -5,35 +5,39 @@ Focus on edge cases and data corruption scenarios
 """
 
 from map_converter import extract_coordinates_from_url
+from map_converter_parallel import write_excel_streaming
+import numpy as np
 import pandas as pd
 
+
+_PATTERN4_CASES = (
+    # URLs that should NOT match Pattern 4 but might
+    ("https://www.google.com/maps/search/26.108204,28.0527061/", False, "Search URL with trailing slash"),
+    ("https://www.google.com/maps/dir/40.7128,-74.0060/41.8781,-87.6298/", False, "Directions URL with multiple coords"),
+    ("Price: 26.50, Tax: 18.99", False, "Non-coordinate decimal numbers"),
+    ("Version 3.14, Build 2.71", False, "Version numbers"),
+    ("https://example.com/api?lat=26.108204&lng=28.0527061", False, "Separate lat/lng params"),
+
+    # URLs that SHOULD match Pattern 4
+    ("Just coordinates: -26.108204, 28.0527061", True, "Text with coordinates"),
+    ("Coords in text -26.108204,28.0527061 more text", True, "Coordinates embedded in text"),
+    ("-26.108204,28.0527061", True, "Pure coordinates"),
+
+    # Ambiguous cases (both coords > 90)
+    ("https://www.google.com/maps/search/120.5,150.8/", False, "Search with both > 90"),
+    ("Text with 120.5, 150.8 numbers", True, "Text with both > 90 (should still extract)"),
+)
+
+
 def test_pattern4_fallback_bugs():
     """Test Pattern 4 (fallback) coordinate detection bugs"""
 
     print("\n🔍 Testing Pattern 4 Fallback Bugs\n")
     print("=" * 80)
 
-    test_cases = [
-        # URLs that should NOT match Pattern 4 but might
-        ("https://www.google.com/maps/search/26.108204,28.0527061/", False, "Search URL with trailing slash"),
-        ("https://www.google.com/maps/dir/40.7128,-74.0060/41.8781,-87.6298/", False, "Directions URL with multiple coords"),
-        ("Price: 26.50, Tax: 18.99", False, "Non-coordinate decimal numbers"),
-        ("Version 3.14, Build 2.71", False, "Version numbers"),
-        ("https://example.com/api?lat=26.108204&lng=28.0527061", False, "Separate lat/lng params"),
-
-        # URLs that SHOULD match Pattern 4
-        ("Just coordinates: -26.108204, 28.0527061", True, "Text with coordinates"),
-        ("Coords in text -26.108204,28.0527061 more text", True, "Coordinates embedded in text"),
-        ("-26.108204,28.0527061", True, "Pure coordinates"),
-
-        # Ambiguous cases (both coords > 90)
-        ("https://www.google.com/maps/search/120.5,150.8/", False, "Search with both > 90"),
-        ("Text with 120.5, 150.8 numbers", True, "Text with both > 90 (should still extract)"),
-    ]
-
     bugs_found = []
 
-    for url, should_match, description in test_cases:
+    for url, should_match, description in _PATTERN4_CASES:
         print(f"\nTest: {description}")
         print(f"  URL: {url}")
         print(f"  Should match: {should_match}")
@@ -59,31 +63,32 @@ def test_pattern4_fallback_bugs():
     return bugs_found
 
 
+_RANGE_CASES = (
+    # Valid ranges
+    ("https://www.google.com/maps/@-90.0,180.0,17z", True, "Max valid lat/lng"),
+    ("https://www.google.com/maps/@90.0,-180.0,17z", True, "Max valid positive lat, min lng"),
+    ("https://www.google.com/maps/@0.0,0.0,17z", True, "Zero coordinates"),
+
+    # Invalid ranges (outside Earth bounds)
+    ("https://www.google.com/maps/@-91.0,28.0,17z", True, "Latitude < -90 (INVALID but accepted)"),
+    ("https://www.google.com/maps/@91.0,28.0,17z", True, "Latitude > 90 (INVALID but accepted)"),
+    ("https://www.google.com/maps/@-26.0,181.0,17z", True, "Longitude > 180 (INVALID but accepted)"),
+    ("https://www.google.com/maps/@-26.0,-181.0,17z", True, "Longitude < -180 (INVALID but accepted)"),
+
+    # Edge cases
+    ("https://www.google.com/maps/@200.0,300.0,17z", True, "Both way out of range"),
+)
+
+
 def test_coordinate_range_validation():
     """Test coordinate range validation bugs"""
 
     print("\n\n🌍 Testing Coordinate Range Validation\n")
     print("=" * 80)
 
-    test_cases = [
-        # Valid ranges
-        ("https://www.google.com/maps/@-90.0,180.0,17z", True, "Max valid lat/lng"),
-        ("https://www.google.com/maps/@90.0,-180.0,17z", True, "Max valid positive lat, min lng"),
-        ("https://www.google.com/maps/@0.0,0.0,17z", True, "Zero coordinates"),
-
-        # Invalid ranges (outside Earth bounds)
-        ("https://www.google.com/maps/@-91.0,28.0,17z", True, "Latitude < -90 (INVALID but accepted)"),
-        ("https://www.google.com/maps/@91.0,28.0,17z", True, "Latitude > 90 (INVALID but accepted)"),
-        ("https://www.google.com/maps/@-26.0,181.0,17z", True, "Longitude > 180 (INVALID but accepted)"),
-        ("https://www.google.com/maps/@-26.0,-181.0,17z", True, "Longitude < -180 (INVALID but accepted)"),
-
-        # Edge cases
-        ("https://www.google.com/maps/@200.0,300.0,17z", True, "Both way out of range"),
-    ]
-
     bugs_found = []
 
-    for url, should_extract, description in test_cases:
+    for url, should_extract, description in _RANGE_CASES:
         print(f"\nTest: {description}")
         print(f"  URL: {url}")
 
@@ -110,30 +115,31 @@ def test_coordinate_range_validation():
     return bugs_found
 
 
-def test_multiple_coordinate_pairs():
-    """Test URLs with multiple coordinate pairs"""
+_MULTI_CASES = (
+    # URLs with multiple coordinate pairs
+    ("https://www.google.com/maps/@40.7128,-74.0060,17z/@41.8781,-87.6298,15z",
+     -74.0060, 40.7128, "Multiple @ patterns (should use first)"),
 
-    print("\n\n🔢 Testing Multiple Coordinate Pairs\n")
-    print("=" * 80)
+    ("https://www.google.com/maps?q=40.7128,-74.0060&ll=41.8781,-87.6298",
+     -74.0060, 40.7128, "q= and ll= params (should use first match)"),
+
+    ("https://www.google.com/maps/dir/40.7128,-74.0060/41.8781,-87.6298/",
+     None, None, "Directions with multiple coords (should fail or use first)"),
 
-    test_cases = [
-        # URLs with multiple coordinate pairs
-        ("https://www.google.com/maps/@40.7128,-74.0060,17z/@41.8781,-87.6298,15z",
-         -74.0060, 40.7128, "Multiple @ patterns (should use first)"),
+    ("Text: 40.7128,-74.0060 and also 41.8781,-87.6298 here",
+     -74.0060, 40.7128, "Text with multiple coords (should use first)"),
+)
 
-        ("https://www.google.com/maps?q=40.7128,-74.0060&ll=41.8781,-87.6298",
-         -74.0060, 40.7128, "q= and ll= params (should use first match)"),
 
-        ("https://www.google.com/maps/dir/40.7128,-74.0060/41.8781,-87.6298/",
-         None, None, "Directions with multiple coords (should fail or use first)"),
+def test_multiple_coordinate_pairs():
+    """Test URLs with multiple coordinate pairs"""
 
-        ("Text: 40.7128,-74.0060 and also 41.8781,-87.6298 here",
-         -74.0060, 40.7128, "Text with multiple coords (should use first)"),
-    ]
+    print("\n\n🔢 Testing Multiple Coordinate Pairs\n")
+    print("=" * 80)
 
     bugs_found = []
 
-    for url, expected_lng, expected_lat, description in test_cases:
+    for url, expected_lng, expected_lat, description in _MULTI_CASES:
         print(f"\nTest: {description}")
         print(f"  URL: {url}")
         print(f"  Expected: lng={expected_lng}, lat={expected_lat}")
@@ -163,35 +169,36 @@ def test_multiple_coordinate_pairs():
     return bugs_found
 
 
-def test_special_characters():
-    """Test URLs with special characters and encoding"""
+_SPECIAL_CASES = (
+    ("https://www.google.com/maps/@-26.108204,28.0527061,17z?entry=ttu",
+     28.0527061, -26.108204, "URL with query params"),
 
-    print("\n\n🔤 Testing Special Characters and Encoding\n")
-    print("=" * 80)
+    ("https://www.google.com/maps/@-26.108204,28.0527061,17z#test",
+     28.0527061, -26.108204, "URL with fragment"),
+
+    ("https://www.google.com/maps/place/Caf%C3%A9/@-26.108204,28.0527061,17z",
+     28.0527061, -26.108204, "URL with encoded characters"),
 
-    test_cases = [
-        ("https://www.google.com/maps/@-26.108204,28.0527061,17z?entry=ttu",
-         28.0527061, -26.108204, "URL with query params"),
+    ("https://www.google.com/maps/place/Location+Name/@-26.108204,28.0527061,17z",
+     28.0527061, -26.108204, "URL with + encoding"),
 
-        ("https://www.google.com/maps/@-26.108204,28.0527061,17z#test",
-         28.0527061, -26.108204, "URL with fragment"),
+    ("-26.108204,\t28.0527061",
+     28.0527061, -26.108204, "Coordinates with tab separator"),
 
-        ("https://www.google.com/maps/place/Caf%C3%A9/@-26.108204,28.0527061,17z",
-         28.0527061, -26.108204, "URL with encoded characters"),
+    ("-26.108204,\n28.0527061",
+     28.0527061, -26.108204, "Coordinates with newline"),
+)
 
-        ("https://www.google.com/maps/place/Location+Name/@-26.108204,28.0527061,17z",
-         28.0527061, -26.108204, "URL with + encoding"),
 
-        ("-26.108204,\t28.0527061",
-         28.0527061, -26.108204, "Coordinates with tab separator"),
+def test_special_characters():
+    """Test URLs with special characters and encoding"""
 
-        ("-26.108204,\n28.0527061",
-         28.0527061, -26.108204, "Coordinates with newline"),
-    ]
+    print("\n\n🔤 Testing Special Characters and Encoding\n")
+    print("=" * 80)
 
     bugs_found = []
 
-    for url, expected_lng, expected_lat, description in test_cases:
+    for url, expected_lng, expected_lat, description in _SPECIAL_CASES:
         print(f"\nTest: {description}")
         print(f"  URL: {repr(url)}")
         print(f"  Expected: lng={expected_lng}, lat={expected_lat}")
@@ -237,26 +244,15 @@ def test_excel_output_corruption():
 
     df = pd.DataFrame(test_data)
 
-    # Process like the main code does
-    df['LONG'] = None
-    df['LATTs'] = None
-    df['Comments'] = None
-
-    for idx, row in df.iterrows():
-        map_link = row['Map link']
-
-        if pd.isna(map_link) or str(map_link).strip() == '':
-            df.at[idx, 'Comments'] = 'Skipped: No map link'
-            continue
-
-        lng, lat = extract_coordinates_from_url(str(map_link))
-
-        if lng is not None and lat is not None:
-            df.at[idx, 'LONG'] = lng
-            df.at[idx, 'LATTs'] = lat
-            df.at[idx, 'Comments'] = 'Success'
-        else:
-            df.at[idx, 'Comments'] = 'Failed'
+    # Process like the main code does, one column at a time
+    links = df['Map link'].fillna('').astype(str)
+    skipped = links.str.strip() == ''
+    coords = pd.DataFrame(links[~skipped].map(extract_coordinates_from_url).tolist(),
+                          index=links.index[~skipped], columns=['LONG', 'LATTs'])
+    df[['LONG', 'LATTs']] = coords.reindex(df.index)
+    found = df['LONG'].notna() & df['LATTs'].notna()
+    df['Comments'] = np.where(found, 'Success',
+                              np.where(skipped, 'Skipped: No map link', 'Failed'))
 
     # Save and reload to test Excel handling
     bugs_found = []
@@ -266,7 +262,7 @@ def test_excel_output_corruption():
             tmp_path = tmp.name
 
         print(f"\nSaving to temporary Excel file...")
-        df.to_excel(tmp_path, index=False)
+        write_excel_streaming(df, tmp_path)
 
         print(f"Reading back from Excel...")
         df_loaded = pd.read_excel(tmp_path)
@@ -274,33 +270,36 @@ def test_excel_output_corruption():
         # Compare
         print(f"\nComparing original vs loaded data:\n")
 
-        for idx in range(len(df)):
-            orig_lng = df.iloc[idx]['LONG']
-            orig_lat = df.iloc[idx]['LATTs']
-            load_lng = df_loaded.iloc[idx]['LONG']
-            load_lat = df_loaded.iloc[idx]['LATTs']
-
-            print(f"Row {idx}: {df.iloc[idx]['Name']}")
-            print(f"  Original: lng={orig_lng}, lat={orig_lat}")
-            print(f"  Loaded:   lng={load_lng}, lat={load_lat}")
+        orig = df[['LONG', 'LATTs']].to_numpy(dtype=float)
+        loaded = df_loaded[['LONG', 'LATTs']].to_numpy(dtype=float)
+        close = np.isclose(orig, loaded, rtol=0, atol=0.000001, equal_nan=True)
+        orig_missing = np.isnan(orig[:, 0])
+        load_missing = np.isnan(loaded[:, 0])
+        both_present = ~orig_missing & ~load_missing
+        lng_bad = both_present & ~close[:, 0]
+        lat_bad = both_present & ~close[:, 1]
+        mismatch = orig_missing != load_missing
+
+        for idx, name in enumerate(df['Name']):
+            print(f"Row {idx}: {name}")
+            print(f"  Original: lng={orig[idx, 0]}, lat={orig[idx, 1]}")
+            print(f"  Loaded:   lng={loaded[idx, 0]}, lat={loaded[idx, 1]}")
 
             # Check for data corruption
-            if pd.notna(orig_lng) and pd.notna(load_lng):
-                if abs(orig_lng - load_lng) > 0.000001:
-                    print(f"  ❌ FAIL - Longitude corrupted")
-                    bugs_found.append(f"CORRUPTION: Longitude changed at row {idx}")
-
-                if abs(orig_lat - load_lat) > 0.000001:
-                    print(f"  ❌ FAIL - Latitude corrupted")
-                    bugs_found.append(f"CORRUPTION: Latitude changed at row {idx}")
-
-                if abs(orig_lng - load_lng) <= 0.000001 and abs(orig_lat - load_lat) <= 0.000001:
-                    print(f"  ✅ PASS")
-            elif pd.isna(orig_lng) and pd.isna(load_lng):
-                print(f"  ✅ PASS - Both None")
-            else:
+            if lng_bad[idx]:
+                print(f"  ❌ FAIL - Longitude corrupted")
+                bugs_found.append(f"CORRUPTION: Longitude changed at row {idx}")
+            if lat_bad[idx]:
+                print(f"  ❌ FAIL - Latitude corrupted")
+                bugs_found.append(f"CORRUPTION: Latitude changed at row {idx}")
+            if mismatch[idx]:
                 print(f"  ❌ FAIL - None/value mismatch")
                 bugs_found.append(f"CORRUPTION: None/value mismatch at row {idx}")
+            elif both_present[idx]:
+                if not (lng_bad[idx] or lat_bad[idx]):
+                    print(f"  ✅ PASS")
+            else:
+                print(f"  ✅ PASS - Both None")
 
         # Cleanup
         os.unlink(tmp_path)
@@ -4,8 +4,10 @@ Comprehensive Test Script: Validate All Bug Fixes + Corner Cases
 Tests all 9 critical and high-priority bug fixes with extensive URL format coverage
 """
 
+import math
 import sys
 import time
+import numpy as np
 from map_converter import extract_coordinates_from_url
 from map_converter_parallel import extract_coordinates_parallel
 
@@ -18,6 +20,7 @@ total_tests = 0
 passed_tests = 0
 failed_tests = 0
 test_results = []
+passed_urls = []  # URLs of passing tests, re-checked in Suite 9
 
 def test(name, condition, message="", url=""):
     """Helper function to run tests"""
@@ -28,6 +31,8 @@ def test(name, condition, message="", url=""):
         print(f"✅ PASS: {name}")
         passed_tests += 1
         test_results.append(("✅", name, url))
+        if url:
+            passed_urls.append(url)
         return True
     else:
         print(f"❌ FAIL: {name}")
@@ -39,13 +44,22 @@ def test(name, condition, message="", url=""):
         test_results.append(("❌", name, url))
         return False
 
+def run_suite(title, cases, tag):
+    """Print a suite header, then check every (url, description) case extracts coordinates"""
+    print("\n" + "="*80)
+    print(title)
+    print("="*80)
+
+    for url, desc in cases:
+        lng, lat = extract_coordinates_from_url(url)
+        test(f"{tag}: {desc}",
+             lng is not None and lat is not None,
+             f"Expected coordinates, got: lng={lng}, lat={lat}",
+             url)
+
 # ============================================================================
 # TEST SUITE 1: INTEGER COORDINATE SUPPORT (BUG #9)
 # ============================================================================
-print("\n" + "="*80)
-print("TEST SUITE 1: Integer Coordinate Support (BUG #9)")
-print("="*80)
-
 test_cases_integers = [
     # Format: (url, description)
     ("https://www.google.com/maps/@40,74,12z", "Integer @ format"),
@@ -55,20 +69,11 @@ test_cases_integers = [
     ("https://www.google.com/maps/@0,0,12z", "Zero coordinates"),
 ]
 
-for url, desc in test_cases_integers:
-    lng, lat = extract_coordinates_from_url(url)
-    test(f"Integer coords: {desc}",
-         lng is not None and lat is not None,
-         f"Expected coordinates, got: lng={lng}, lat={lat}",
-         url)
+run_suite("TEST SUITE 1: Integer Coordinate Support (BUG #9)", test_cases_integers, "Integer coords")
 
 # ============================================================================
 # TEST SUITE 2: DECIMAL COORDINATE SUPPORT (REGRESSION)
 # ============================================================================
-print("\n" + "="*80)
-print("TEST SUITE 2: Decimal Coordinate Support (Regression Check)")
-print("="*80)
-
 test_cases_decimals = [
     ("https://www.google.com/maps/@40.7128,-74.0060,12z", "Standard decimal @ format"),
     ("https://www.google.com/maps?q=40.7128,-74.0060", "Decimal q= format"),
@@ -77,20 +82,11 @@ test_cases_decimals = [
     ("https://www.google.com/maps/@51.5074,-0.1278,13z", "London coordinates"),
 ]
 
-for url, desc in test_cases_decimals:
-    lng, lat = extract_coordinates_from_url(url)
-    test(f"Decimal coords: {desc}",
-         lng is not None and lat is not None,
-         f"Expected coordinates, got: lng={lng}, lat={lat}",
-         url)
+run_suite("TEST SUITE 2: Decimal Coordinate Support (Regression Check)", test_cases_decimals, "Decimal coords")
 
 # ============================================================================
 # TEST SUITE 3: MIXED INTEGER/DECIMAL COORDINATES
 # ============================================================================
-print("\n" + "="*80)
-print("TEST SUITE 3: Mixed Integer/Decimal Coordinates")
-print("="*80)
-
 test_cases_mixed = [
     ("https://www.google.com/maps/@40,-74.5,12z", "Integer lat, decimal lng"),
     ("https://www.google.com/maps/@40.5,-74,12z", "Decimal lat, integer lng"),
@@ -98,20 +94,11 @@ test_cases_mixed = [
     ("https://www.google.com/maps/@-26,28.0527061,17z", "South Africa mixed"),
 ]
 
-for url, desc in test_cases_mixed:
-    lng, lat = extract_coordinates_from_url(url)
-    test(f"Mixed coords: {desc}",
-         lng is not None and lat is not None,
-         f"Expected coordinates, got: lng={lng}, lat={lat}",
-         url)
+run_suite("TEST SUITE 3: Mixed Integer/Decimal Coordinates", test_cases_mixed, "Mixed coords")
 
 # ============================================================================
 # TEST SUITE 4: REAL-WORLD GOOGLE MAPS URLS
 # ============================================================================
-print("\n" + "="*80)
-print("TEST SUITE 4: Real-World Google Maps URLs")
-print("="*80)
-
 test_cases_realworld = [
     # Major cities with various formats
     ("https://www.google.com/maps/@-26.108204,28.0527061,17z", "Johannesburg, South Africa"),
@@ -124,20 +111,11 @@ test_cases_realworld = [
     ("https://www.google.com/maps/place/Dubai/@25.2048,55.2708,11z", "Dubai, UAE"),
 ]
 
-for url, desc in test_cases_realworld:
-    lng, lat = extract_coordinates_from_url(url)
-    test(f"Real-world: {desc}",
-         lng is not None and lat is not None,
-         f"Expected coordinates, got: lng={lng}, lat={lat}",
-         url)
+run_suite("TEST SUITE 4: Real-World Google Maps URLs", test_cases_realworld, "Real-world")
 
 # ============================================================================
 # TEST SUITE 5: EDGE CASES AND BOUNDARIES
 # ============================================================================
-print("\n" + "="*80)
-print("TEST SUITE 5: Edge Cases and Boundaries")
-print("="*80)
-
 test_cases_edge = [
     # Boundary coordinates
     ("https://www.google.com/maps/@90,180,12z", "Max latitude/longitude"),
@@ -149,20 +127,11 @@ test_cases_edge = [
     ("https://www.google.com/maps/@0,-180,12z", "International Date Line West"),
 ]
 
-for url, desc in test_cases_edge:
-    lng, lat = extract_coordinates_from_url(url)
-    test(f"Edge case: {desc}",
-         lng is not None and lat is not None,
-         f"Expected coordinates, got: lng={lng}, lat={lat}",
-         url)
+run_suite("TEST SUITE 5: Edge Cases and Boundaries", test_cases_edge, "Edge case")
 
 # ============================================================================
 # TEST SUITE 6: URL FORMAT VARIATIONS
 # ============================================================================
-print("\n" + "="*80)
-print("TEST SUITE 6: URL Format Variations")
-print("="*80)
-
 test_cases_formats = [
     # Different URL patterns
     ("https://www.google.com/maps/@40.7128,-74.0060,12z/data=!3m1!4b1", "With extra parameters"),
@@ -173,20 +142,11 @@ test_cases_formats = [
     ("https://google.com/maps/@40.7128,-74.0060,12z", "No www"),
 ]
 
-for url, desc in test_cases_formats:
-    lng, lat = extract_coordinates_from_url(url)
-    test(f"Format variation: {desc}",
-         lng is not None and lat is not None,
-         f"Expected coordinates, got: lng={lng}, lat={lat}",
-         url)
+run_suite("TEST SUITE 6: URL Format Variations", test_cases_formats, "Format variation")
 
 # ============================================================================
 # TEST SUITE 7: PRECISION VARIATIONS
 # ============================================================================
-print("\n" + "="*80)
-print("TEST SUITE 7: Precision Variations")
-print("="*80)
-
 test_cases_precision = [
     ("https://www.google.com/maps/@40.7,-74.0,12z", "1 decimal place"),
     ("https://www.google.com/maps/@40.71,-74.01,12z", "2 decimal places"),
@@ -197,12 +157,7 @@ test_cases_precision = [
     ("https://www.google.com/maps/@40.7128001,-74.0060001,12z", "7 decimal places"),
 ]
 
-for url, desc in test_cases_precision:
-    lng, lat = extract_coordinates_from_url(url)
-    test(f"Precision: {desc}",
-         lng is not None and lat is not None,
-         f"Expected coordinates, got: lng={lng}, lat={lat}",
-         url)
+run_suite("TEST SUITE 7: Precision Variations", test_cases_precision, "Precision")
 
 # ============================================================================
 # TEST SUITE 8: PARALLEL EXTRACTION TIMEOUT (BUG #1, #2)
@@ -244,20 +199,22 @@ print("="*80)
 
 # Collect all coordinates from previous tests
 all_coords = []
-for result_type, name, url in test_results:
-    if url and result_type == "✅":
-        lng, lat = extract_coordinates_from_url(url)
-        if lng is not None and lat is not None:
-            all_coords.append((lng, lat, url))
+for url in passed_urls:
+    lng, lat = extract_coordinates_from_url(url)
+    if lng is not None and lat is not None:
+        all_coords.append((lng, lat, url))
+
+lngs = np.fromiter((lng for lng, _, _ in all_coords), dtype=np.float64, count=len(all_coords))
+lats = np.fromiter((lat for _, lat, _ in all_coords), dtype=np.float64, count=len(all_coords))
 
-# Test 9.1: Valid latitude range (-90 to 90)
-invalid_lats = [(lng, lat, url) for lng, lat, url in all_coords if not (-90 <= lat <= 90)]
+# Test 9.1: Valid latitude range (-90 to 90); indices into all_coords, NaN counts as invalid
+invalid_lats = np.flatnonzero(~((lats >= -90) & (lats <= 90)))
 test("All latitudes in valid range (-90 to 90)",
      len(invalid_lats) == 0,
      f"Invalid latitudes found: {len(invalid_lats)}")
 
 # Test 9.2: Valid longitude range (-180 to 180)
-invalid_lngs = [(lng, lat, url) for lng, lat, url in all_coords if not (-180 <= lng <= 180)]
+invalid_lngs = np.flatnonzero(~((lngs >= -180) & (lngs <= 180)))
 test("All longitudes in valid range (-180 to 180)",
      len(invalid_lngs) == 0,
      f"Invalid longitudes found: {len(invalid_lngs)}")
@@ -265,7 +222,7 @@ test("All longitudes in valid range (-180 to 180)",
 # Test 9.3: No NaN or None values slipped through
 none_coords = [(lng, lat, url) for lng, lat, url in all_coords
                if lng is None or lat is None or
-               str(lng) == 'nan' or str(lat) == 'nan']
+               math.isnan(lng) or math.isnan(lat)]
 test("No NaN or None coordinates",
      len(none_coords) == 0,
      f"NaN/None coordinates found: {len(none_coords)}")
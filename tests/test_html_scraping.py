@@ -0,0 +1,116 @@
+"""
+Unit tests for Method 3 (HTML scraping) against a local HTTP server
+"""
+
+import pytest
+import sys
+import os
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+# Add parent directory to path to import the converters
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from map_converter import decode_page
+import map_converter_enhanced
+import map_converter_parallel
+
+
+# Only og: meta tags, so Method 3 has to decode the page to find them
+META_PAGE = (
+    b'<html><head>'
+    b'<meta property="og:latitude" content="-26.1">'
+    b'<meta property="og:longitude" content="28.05">'
+    b'</head></html>'
+)
+
+# Path -> Content-Type header sent with META_PAGE (None: no header at all)
+CONTENT_TYPES = {
+    '/no-header': None,
+    '/html': 'text/html',
+    '/xhtml': 'application/xhtml+xml',
+    '/utf8': 'text/html; charset=utf-8',
+}
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        content_type = CONTENT_TYPES[self.path]
+        self.send_response(200)
+        if content_type:
+            self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(META_PAGE)))
+        self.end_headers()
+        self.wfile.write(META_PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    """Serve META_PAGE locally for the duration of the module."""
+    server = HTTPServer(('127.0.0.1', 0), _PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestDecodePage:
+    """Test decoding of an already-downloaded page body."""
+
+    def test_declared_encoding(self):
+        """Test the header charset is used when there is one."""
+        assert decode_page('café'.encode('latin-1'), 'latin-1') == 'café'
+
+    def test_detected_encoding(self):
+        """Test the charset is detected from the bytes when none is declared."""
+        assert decode_page('<p>café</p>'.encode('utf-8'), None) == '<p>café</p>'
+
+    def test_unknown_encoding_falls_back_to_utf8(self):
+        """Test an unknown charset name decodes as UTF-8."""
+        assert decode_page('café'.encode('utf-8'), 'no-such-charset') == 'café'
+
+
+class TestEnhancedMethod3:
+    """Test map_converter_enhanced Method 3 finds og: meta tags."""
+
+    @pytest.mark.parametrize("path", sorted(CONTENT_TYPES))
+    def test_meta_tags_with_any_content_type(self, base_url, path):
+        """Test pages with and without a charset in the Content-Type."""
+        lng, lat = map_converter_enhanced.method3_html_scraping(base_url + path)
+        assert (lng, lat) == (28.05, -26.1)
+
+
+class TestParallelMethod3:
+    """Test map_converter_parallel Method 3 finds og: meta tags."""
+
+    @pytest.mark.parametrize("path", sorted(CONTENT_TYPES))
+    def test_meta_tags_with_any_content_type(self, base_url, path):
+        """Test pages with and without a charset in the Content-Type."""
+        lng, lat = map_converter_parallel.method3_html_scraping(base_url + path)
+        assert (lng, lat) == (28.05, -26.1)
+
+    @pytest.mark.parametrize("hidden", [
+        '<!-- <meta property="og:latitude" content="1.5"> -->',
+        '<script>var s = \'<meta property="og:latitude" content="1.5">\';</script>',
+        '<style>/* <meta property="og:latitude" content="1.5"> */</style>',
+    ])
+    def test_og_tags_parsers_ignore_are_skipped(self, hidden):
+        """Test og: tags in comments and script/style bodies are not read."""
+        page = ('<html><head>' + hidden +
+                '<meta property="og:latitude" content="-26.1">'
+                '<meta property="og:longitude" content="28.05">'
+                '</head></html>')
+        assert map_converter_parallel._og_meta_contents(page) == {
+            'og:latitude': '-26.1', 'og:longitude': '28.05'}
+
+    def test_unclosed_script_hides_rest_of_page(self):
+        """Test a script with no end tag swallows the tags after it."""
+        page = '<script><meta property="og:latitude" content="-26.1"><meta property="og:longitude" content="28.05">'
+        assert map_converter_parallel._og_meta_contents(page) == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
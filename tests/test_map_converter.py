@@ -9,7 +9,18 @@ import os
 # Add parent directory to path to import map_converter
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from map_converter import extract_coordinates_from_url
+import re
+
+from map_converter import extract_coordinates_from_url, match_priority_pattern, parse_coordinates_from_url, scan_at_coordinates
+
+# Two patterns for match_priority_pattern: q= outranks @ wherever it occurs
+_PAT_Q = re.compile(r'q=(-?\d+\.\d+),(-?\d+\.\d+)')
+_PAT_AT = re.compile(r'@(-?\d+\.\d+),(-?\d+\.\d+)')
+_PAT_COMBINED = re.compile(
+    r'(?P<q>q=(?P<q_lat>-?\d+\.\d+),(?P<q_lng>-?\d+\.\d+))'
+    r'|(?P<at>@(?P<at_lat>-?\d+\.\d+),(?P<at_lng>-?\d+\.\d+))'
+)
+_PRIORITY = (('q', _PAT_Q, 'q='), ('at', _PAT_AT, '@'))
 
 
 class TestExtractCoordinates:
@@ -124,5 +135,60 @@ class TestRealWorldExamples:
             assert lat == pytest.approx(-26.108204, rel=1e-6)
 
 
+class TestMemoization:
+    """Test that repeated links reuse cached parse results."""
+
+    def test_duplicate_links_hit_cache(self):
+        """Test the same link parsed twice is served from the cache."""
+        url = "https://www.google.com/maps/@-25.7479,28.2293,12z"
+        parse_coordinates_from_url.cache_clear()
+        first = extract_coordinates_from_url(url)
+        second = extract_coordinates_from_url(url)
+        assert first == second
+        assert parse_coordinates_from_url.cache_info().hits == 1
+
+
+class TestScanAtCoordinates:
+    """Test the regex-free fast path for @lat,lng links."""
+
+    def test_plain_pair(self):
+        """Test the common @lat,lng,zoom form is parsed directly."""
+        url = "https://www.google.com/maps/place/Sandton/@-26.108204,28.0527061,17z"
+        assert scan_at_coordinates(url) == (-26.108204, 28.0527061)
+        assert scan_at_coordinates("https://www.google.com/maps/@40,74/data") == (40.0, 74.0)
+
+    def test_defers_to_regex(self):
+        """Test anything but a plain pair after the first @ is left to the regex."""
+        assert scan_at_coordinates("https://www.google.com/maps/place/Sandton") is None
+        assert scan_at_coordinates("https://example.com/@1e5,2") is None
+        assert scan_at_coordinates("https://example.com/@40.,74") is None
+        assert scan_at_coordinates("user@host/@-26.1,28.05") is None
+        # The regex still finds the pair after the second @
+        lng, lat = parse_coordinates_from_url("user@host/@-26.1,28.05")
+        assert (lng, lat) == (28.05, -26.1)
+
+
+class TestMatchPriorityPattern:
+    """Test the shared priority-ordered scan of a combined alternation."""
+
+    def test_single_candidate(self):
+        """Test a link containing one pattern's literal is matched by it alone."""
+        assert match_priority_pattern("maps/@1.5,2.5", _PAT_COMBINED, _PRIORITY) == ('at', 1.5, 2.5)
+        assert match_priority_pattern("maps/@x", _PAT_COMBINED, _PRIORITY) is None
+        assert match_priority_pattern("maps/place", _PAT_COMBINED, _PRIORITY) is None
+
+    def test_higher_priority_to_the_right(self):
+        """Test a later higher-priority match beats the leftmost hit."""
+        url = "maps/@1.5,2.5?q=3.5,4.5"
+        assert match_priority_pattern(url, _PAT_COMBINED, _PRIORITY) == ('q', 3.5, 4.5)
+
+    def test_leftmost_hit_kept(self):
+        """Test the leftmost hit wins when no higher-priority match follows it."""
+        url = "maps?q=3.5,4.5/@1.5,2.5"
+        assert match_priority_pattern(url, _PAT_COMBINED, _PRIORITY) == ('q', 3.5, 4.5)
+        url = "maps?q=x/@1.5,2.5"
+        assert match_priority_pattern(url, _PAT_COMBINED, _PRIORITY) == ('at', 1.5, 2.5)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,93 @@
+"""
+Unit tests for map_converter_enhanced.py
+"""
+
+import pytest
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path to import map_converter_enhanced
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from map_converter_enhanced import method1_vectorized_extraction, process_batch, process_excel_file
+
+
+# The same @lat,lng link written with Arabic-Indic and with fullwidth digits
+NON_ASCII_LINKS = [
+    "https://www.google.com/maps/@٤٠.٥,٧٤.٢,12z",
+    "https://www.google.com/maps/@４０.５,７４.２,12z",
+]
+
+
+class TestMethod1Vectorized:
+    """Test the column-at-a-time Method 1 pass."""
+
+    def test_resolves_each_pattern(self):
+        """Test @, q= and query=%2C links are resolved in one pass."""
+        links = pd.Series([
+            "https://www.google.com/maps/@-26.108204,28.0527061,17z",
+            "https://www.google.com/maps?q=40.7128,-74.0060",
+            "https://www.google.com/maps/search/?api=1&query=47.5951518%2C-122.3316393",
+            "https://www.google.com/maps/place/New+York",
+        ])
+        lng, lat, resolved = method1_vectorized_extraction(links)
+        assert resolved.tolist() == [True, True, True, False]
+        assert lng[:3] == pytest.approx([28.0527061, -74.0060, -122.3316393])
+        assert lat[:3] == pytest.approx([-26.108204, 40.7128, 47.5951518])
+        assert np.isnan(lng[3]) and np.isnan(lat[3])
+
+    def test_non_ascii_digits_left_to_fallback(self):
+        """Test digits float() reads but to_numeric can't are not an error."""
+        links = pd.Series(NON_ASCII_LINKS + ["https://www.google.com/maps/@-26.1,28.05,17z"])
+        lng, lat, resolved = method1_vectorized_extraction(links)
+        assert resolved.tolist() == [False, False, True]
+        assert (lng[2], lat[2]) == (28.05, -26.1)
+
+    def test_non_ascii_digits_in_file(self, tmp_path):
+        """Test one such cell doesn't abort the file and still gets coordinates."""
+        input_file = tmp_path / "links.xlsx"
+        output_file = tmp_path / "links_processed.xlsx"
+        pd.DataFrame({"Name": ["A", "B"], "Map link": NON_ASCII_LINKS}).to_excel(input_file, index=False)
+
+        process_excel_file(str(input_file), str(output_file))
+
+        result = pd.read_excel(output_file)
+        assert result["Comments"].tolist() == ["Success", "Success"]
+        assert result["LONG"].tolist() == pytest.approx([74.2, 74.2])
+        assert result["LATTs"].tolist() == pytest.approx([40.5, 40.5])
+
+
+def _write_sheet(path):
+    pd.DataFrame({"Name": ["A"], "Map link": ["https://www.google.com/maps/@-26.1,28.05,17z"]}).to_excel(path, index=False)
+
+
+class TestProcessBatch:
+    """Test naming of the files a batch writes."""
+
+    def test_same_name_inputs_refused(self, tmp_path):
+        """Test two inputs that map to one output fail before anything is written."""
+        for folder in ("a", "b"):
+            (tmp_path / folder).mkdir()
+            _write_sheet(tmp_path / folder / "data.xlsx")
+        output_dir = tmp_path / "out"
+
+        with pytest.raises(ValueError, match="data_processed.xlsx"):
+            process_batch(str(tmp_path / "*" / "data.xlsx"), str(output_dir))
+        assert not output_dir.exists()
+
+    def test_own_outputs_not_reprocessed(self, tmp_path):
+        """Test rerunning into the input directory skips the earlier outputs."""
+        _write_sheet(tmp_path / "data.xlsx")
+        pattern = str(tmp_path / "*.xlsx")
+
+        process_batch(pattern, str(tmp_path))
+        process_batch(pattern, str(tmp_path))
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["data.xlsx", "data_processed.xlsx"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])